@@ -1,12 +1,15 @@
 """Author identification using Claude AI with web search fallback."""
 
-from typing import Any, Dict
+import asyncio
+import re
+from typing import Any, Dict, Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from rich.console import Console
+from selectolax.lexbor import LexborHTMLParser
 
-from ai.claude_client import get_client, is_api_available
+from ai.claude_client import get_client, is_api_available, truncate_for_prompt
 from utils.storage import load_config
 
 console = Console()
@@ -14,6 +17,66 @@ console = Console()
 # Web search timeout in seconds
 WEB_SEARCH_TIMEOUT = 5
 
+# Quotes shorter than this are too generic for a web search to attribute
+MIN_SEARCH_WORDS = 5
+MIN_SEARCH_CHARS = 20
+
+_STOPWORDS = frozenset(
+    "a an and are as at be but by do for from have he i if in is it me my no "
+    "not of on or so that the this to was we what when who will with you your".split()
+)
+
+# Trailing attribution already in the pasted text, e.g. "... — Mark Twain"
+# (a plain hyphen only counts at the start of a line, as in "...\n- Name");
+# the tail must look like a name of 2-4 words, each checked further below
+_ATTRIBUTION_RE = re.compile(
+    r"(?:\s(?:—|–|--)|\n\s*-)\s*([^\W\d_][\w.'’-]*(?:[ \t]+[^\W\d_][\w.'’-]*){1,3})\s*$"
+)
+
+# Phrases in a search result that suggest it names the author
+_INDICATORS = (" by ", " - ", "author:", "said by", "quote from")
+
+# Shared session so repeated lookups reuse the same keep-alive connection
+_SESSION = requests.Session()
+_SESSION.headers.update(
+    {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+
+def split_attribution(quote_text: str) -> Tuple[str, Optional[str]]:
+    """
+    Split a trailing attribution such as "— Mark Twain" off quote text.
+
+    The tail only counts as a name if it has 2-4 words, each capitalised
+    and none a common word like "I" or "No", so a mid-sentence dash
+    ("... impossible to achieve — Fear") isn't taken for an author.
+
+    Args:
+        quote_text: The text of the quote
+
+    Returns:
+        (text without the attribution, author name), or the stripped text
+        and None if it doesn't end with an attribution
+    """
+    text = quote_text.strip()
+    match = _ATTRIBUTION_RE.search(text)
+    if not match:
+        return text, None
+
+    words = match.group(1).split()
+    if any(
+        not word[0].isupper() or word.strip(".'’").lower() in _STOPWORDS
+        for word in words
+    ):
+        return text, None
+
+    # Drop a sentence-ending period, but keep one closing "Jr." or "J."
+    if words[-1].endswith(".") and len(words[-1]) > 3:
+        words[-1] = words[-1][:-1]
+
+    return text[: match.start()].rstrip(), " ".join(words)
+
 
 def identify_author(quote_text: str) -> Dict[str, Any]:
     """
@@ -40,7 +103,7 @@ def identify_author(quote_text: str) -> Dict[str, Any]:
     prompt = f"""Who said this quote? If you're confident (>70% sure), provide the author's name.
 If you're unsure or don't know, respond with "Anonymous".
 
-Quote: \"\"\"{quote_text}\"\"\"
+Quote: \"\"\"{truncate_for_prompt(quote_text)}\"\"\"
 
 Respond with ONLY a JSON object in this exact format:
 {{
@@ -104,6 +167,21 @@ def search_web_for_author(quote_text: str) -> Dict[str, Any]:
             - method: 'web_search'
             - found: Boolean indicating if author was found
     """
+    # Short or all-stopword quotes only return noise, so skip the request
+    words = [word.strip(".,;:!?\"'").lower() for word in quote_text.split()]
+    if (
+        len(words) < MIN_SEARCH_WORDS
+        or len(quote_text.strip()) < MIN_SEARCH_CHARS
+        or all(word in _STOPWORDS for word in words)
+    ):
+        return {
+            "author": "Anonymous",
+            "confidence": 0.0,
+            "source": "",
+            "method": "web_search",
+            "found": False,
+        }
+
     try:
         # Use DuckDuckGo HTML search
         # Prepare search query - use first 50 chars of quote for better results
@@ -115,20 +193,14 @@ def search_web_for_author(quote_text: str) -> Dict[str, Any]:
             "q": search_query,
         }
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
-
-        response = requests.get(
-            url, params=params, headers=headers, timeout=WEB_SEARCH_TIMEOUT
-        )
+        response = _SESSION.get(url, params=params, timeout=WEB_SEARCH_TIMEOUT)
         response.raise_for_status()
 
         # Parse HTML results
-        soup = BeautifulSoup(response.content, "html.parser")
+        tree = LexborHTMLParser(response.content)
 
         # Look for results
-        results = soup.find_all("div", {"class": "result"})
+        results = tree.css("div.result")
 
         if not results:
             return {
@@ -139,19 +211,19 @@ def search_web_for_author(quote_text: str) -> Dict[str, Any]:
                 "found": False,
             }
 
-        # Extract text from first few results
-        for result in results[:3]:
-            text = result.get_text()
+        # Extract text from first few results (each .text() walks the DOM)
+        top_results = results[:3]
+        texts = [result.text() for result in top_results]
+
+        for result, text in zip(top_results, texts):
+            text_lower = text.lower()
 
             # Look for common author indicators in result text
-            if any(
-                indicator in text.lower()
-                for indicator in [" by ", " - ", "author:", "said by", "quote from"]
-            ):
+            if any(indicator in text_lower for indicator in _INDICATORS):
                 # Try to extract author name
                 # This is a simple heuristic - look for names after common indicators
-                if " by " in text.lower():
-                    parts = text.lower().split(" by ")
+                if " by " in text_lower:
+                    parts = text_lower.split(" by ")
                     if len(parts) > 1:
                         author_candidate = parts[1].split("\n")[0].strip()
                         if len(author_candidate) < 100:  # Sanity check
@@ -159,10 +231,8 @@ def search_web_for_author(quote_text: str) -> Dict[str, Any]:
                                 "author": author_candidate.title(),
                                 "confidence": 0.65,
                                 "source": (
-                                    result.find("a", {"class": "result__url"}).get_text(
-                                        strip=True
-                                    )
-                                    if result.find("a", {"class": "result__url"})
+                                    result.css_first("a.result__url").text(strip=True)
+                                    if result.css_first("a.result__url")
                                     else ""
                                 ),
                                 "method": "web_search",
@@ -170,7 +240,7 @@ def search_web_for_author(quote_text: str) -> Dict[str, Any]:
                             }
 
         # Check if we found any quote-related results
-        full_text = " ".join([r.get_text() for r in results[:3]])
+        full_text = " ".join(texts)
         if "quote" in full_text.lower() or "said" in full_text.lower():
             # We found quote context but couldn't parse author
             return {
@@ -250,9 +320,7 @@ def identify_author_enhanced(quote_text: str) -> Dict[str, Any]:
     # Step 2: Check if web search is enabled
     try:
         config = load_config()
-        enable_web_search = config.get("preferences", {}).get(
-            "enable_web_search_author", True
-        )
+        enable_web_search = config.preferences.enable_web_search_author
         if not enable_web_search:
             # Web search disabled, return Claude's best guess
             if claude_result["confidence"] > 0:
@@ -292,6 +360,21 @@ def identify_author_enhanced(quote_text: str) -> Dict[str, Any]:
     }
 
 
+async def identify_author_enhanced_async(quote_text: str) -> Dict[str, Any]:
+    """
+    Run identify_author_enhanced in a worker thread.
+
+    Lets callers overlap author lookup with other AI requests.
+
+    Args:
+        quote_text: The text of the quote to identify
+
+    Returns:
+        Same dictionary as identify_author_enhanced
+    """
+    return await asyncio.to_thread(identify_author_enhanced, quote_text)
+
+
 def identify_author_safe(quote_text: str) -> str:
     """
     Safely identify author with fallback to "Anonymous".
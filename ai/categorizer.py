@@ -1,10 +1,11 @@
 """Category suggestion using Claude AI."""
 
+import asyncio
 from typing import Any, Dict, List
 
 from rich.console import Console
 
-from ai.claude_client import get_client, is_api_available
+from ai.claude_client import get_client, is_api_available, truncate_for_prompt
 
 console = Console()
 
@@ -27,6 +28,9 @@ def suggest_categories(quote_text: str) -> Dict[str, Any]:
     """
     Analyze quote and suggest categories using Claude AI.
 
+    Responses are served from the Claude response cache when the same quote
+    (ignoring whitespace) was categorized before.
+
     Args:
         quote_text: The text of the quote to analyze
 
@@ -44,11 +48,15 @@ def suggest_categories(quote_text: str) -> Dict[str, Any]:
 
     client = get_client()
 
+    # Line breaks and spacing don't affect categories; normalising them lets
+    # a re-pasted quote reuse the cached response
+    quote_text = " ".join(quote_text.split())
+
     prompt = f"""Analyze this quote and suggest 2-4 categories from the following list:
 
 Categories: {", ".join(PREDEFINED_CATEGORIES)}
 
-Quote: \"\"\"{quote_text}\"\"\"
+Quote: \"\"\"{truncate_for_prompt(quote_text)}\"\"\"
 
 Respond with ONLY a JSON object in this exact format:
 {{
@@ -97,6 +105,21 @@ Suggest between 2 and 4 categories that best fit the quote's themes and message.
         }
 
 
+async def suggest_categories_async(quote_text: str) -> Dict[str, Any]:
+    """
+    Run suggest_categories in a worker thread.
+
+    Lets callers overlap category suggestion with other AI requests.
+
+    Args:
+        quote_text: The text of the quote to analyze
+
+    Returns:
+        Same dictionary as suggest_categories
+    """
+    return await asyncio.to_thread(suggest_categories, quote_text)
+
+
 def suggest_categories_safe(quote_text: str) -> List[str]:
     """
     Safely suggest categories with fallback to empty list.
@@ -1,33 +1,154 @@
 """Claude API client wrapper for quotes manager."""
 
+import hashlib
 import json
 import os
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Iterator, Optional, Union
 
-import anthropic
 from dotenv import load_dotenv
 from rich.console import Console
 
+from utils.storage import CLAUDE_CACHE_DIR
+
+# Optional faster JSON parser (orjson's decode error subclasses json's)
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
+
 console = Console()
 
 # Load environment variables
 load_dotenv()
 
+# Cached responses are reused for 30 days
+CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Longest quote text inlined into a prompt; beyond this it only adds cost
+MAX_PROMPT_TEXT_CHARS = 1000
+
+
+def _json_loads(text: Union[str, bytes]) -> Any:
+    """Parse JSON text or UTF-8 bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def truncate_for_prompt(text: str, limit: int = MAX_PROMPT_TEXT_CHARS) -> str:
+    """Cap text inlined into a prompt, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "…"
+
+
+def _cache_enabled() -> bool:
+    """Check whether response caching is enabled (disable with QUOTES_NO_CACHE=1)."""
+    no_cache = os.getenv("QUOTES_NO_CACHE", "")
+    return no_cache.strip().lower() not in {"1", "true", "yes", "on"}
+
 
 class ClaudeClient:
     """Wrapper for Claude API interactions."""
 
     def __init__(self):
         """Initialize Claude client with API key from environment."""
+        # Pick up a .env created after this module was imported
+        load_dotenv()
         self.api_key = os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
             raise ValueError(
                 "ANTHROPIC_API_KEY not found in environment. "
                 "Please set it in your .env file."
             )
+        # The SDK is slow to import, so only load it once a client is needed
+        import anthropic
+
         # Initialize client with only api_key (avoid passing unsupported kwargs)
         self.client = anthropic.Anthropic(api_key=self.api_key)
+        self._api_error = anthropic.APIError
         self.model = "claude-sonnet-4-20250514"
+        # In-process layer in front of the on-disk response cache
+        self._memory_cache: Dict[str, str] = {}
+
+    def _cache_key(self, prompt: str, max_tokens: int, system: Optional[str]) -> str:
+        """Build the response cache key for a request."""
+        raw = f"{self.model}|{max_tokens}|{system or ''}|{prompt}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Return a cached response, or None if missing or expired."""
+        if key in self._memory_cache:
+            return self._memory_cache[key]
+
+        try:
+            entry = _json_loads((CLAUDE_CACHE_DIR / f"{key}.json").read_bytes())
+        except Exception:
+            return None
+
+        if not isinstance(entry, dict):
+            return None
+        text = entry.get("text")
+        if not isinstance(text, str):
+            return None
+        created = entry.get("created", 0)
+        if not isinstance(created, (int, float)):
+            return None
+        if time.time() - created > CACHE_TTL_SECONDS:
+            # Remove expired entries so the cache directory doesn't keep growing
+            self._cache_discard(key)
+            return None
+
+        self._memory_cache[key] = text
+        return text
+
+    def _cache_set(self, key: str, text: str) -> None:
+        """Store a response in the memory and on-disk caches."""
+        self._memory_cache[key] = text
+        try:
+            CLAUDE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(CLAUDE_CACHE_DIR / f"{key}.json", "w", encoding="utf-8") as f:
+                json.dump({"created": time.time(), "text": text}, f, ensure_ascii=False)
+        except Exception:
+            pass  # Caching is best-effort
+
+    def _cache_discard(self, key: str) -> None:
+        """Remove a response from the memory and on-disk caches."""
+        self._memory_cache.pop(key, None)
+        try:
+            (CLAUDE_CACHE_DIR / f"{key}.json").unlink()
+        except Exception:
+            pass
+
+    def discard_cached(
+        self, prompt: str, max_tokens: int = 1000, system: Optional[str] = None
+    ) -> None:
+        """
+        Drop a cached response, e.g. one the caller found to be malformed.
+
+        Args:
+            prompt: The prompt the response was cached for
+            max_tokens: Maximum tokens the request was sent with
+            system: Optional system prompt the request was sent with
+        """
+        self._cache_discard(self._cache_key(prompt, max_tokens, system))
+
+    def _message_params(
+        self, prompt: str, max_tokens: int, system: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build the keyword arguments for a messages API request."""
+        message_params: Dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+        if system:
+            message_params["system"] = system
+
+        return message_params
 
     def complete(
         self,
@@ -38,6 +159,10 @@ class ClaudeClient:
         """
         Send completion request to Claude API.
 
+        Responses are cached on disk keyed by model, max_tokens, system prompt
+        and prompt, so repeating an identical request skips the API call.
+        Set QUOTES_NO_CACHE=1 to bypass the cache.
+
         Args:
             prompt: The user prompt to send
             max_tokens: Maximum tokens in response
@@ -49,22 +174,73 @@ class ClaudeClient:
         Raises:
             Exception: If API call fails
         """
-        try:
-            message_params = {
-                "model": self.model,
-                "max_tokens": max_tokens,
-                "messages": [{"role": "user", "content": prompt}],
-            }
-
-            if system:
-                message_params["system"] = system
+        use_cache = _cache_enabled()
+        if use_cache:
+            key = self._cache_key(prompt, max_tokens, system)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
 
+        try:
+            message_params = self._message_params(prompt, max_tokens, system)
             response = self.client.messages.create(**message_params)
 
             # Extract text from response
-            return response.content[0].text
+            text = response.content[0].text
+            if use_cache:
+                self._cache_set(key, text)
+            return text
 
-        except anthropic.APIError as e:
+        except self._api_error as e:
+            console.print(f"[red]Claude API error: {e}[/red]")
+            raise
+        except Exception as e:
+            console.print(f"[red]Unexpected error calling Claude API: {e}[/red]")
+            raise
+
+    def complete_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 1000,
+        system: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Send completion request to Claude API, yielding text as it arrives.
+
+        Shares the response cache with complete(): a cached response is
+        yielded as a single chunk, and a fully streamed response is cached.
+
+        Args:
+            prompt: The user prompt to send
+            max_tokens: Maximum tokens in response
+            system: Optional system prompt
+
+        Yields:
+            Chunks of response text from Claude
+
+        Raises:
+            Exception: If API call fails
+        """
+        use_cache = _cache_enabled()
+        if use_cache:
+            key = self._cache_key(prompt, max_tokens, system)
+            cached = self._cache_get(key)
+            if cached is not None:
+                yield cached
+                return
+
+        try:
+            message_params = self._message_params(prompt, max_tokens, system)
+            chunks = []
+            with self.client.messages.stream(**message_params) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    yield text
+
+            if use_cache:
+                self._cache_set(key, "".join(chunks))
+
+        except self._api_error as e:
             console.print(f"[red]Claude API error: {e}[/red]")
             raise
         except Exception as e:
@@ -96,8 +272,20 @@ class ClaudeClient:
 
         try:
             # Try to parse the response as JSON
-            return json.loads(response_text)
+            return _json_loads(response_text)
         except json.JSONDecodeError as e:
+            # Claude sometimes wraps the object in code fences or a preamble,
+            # so retry on the outermost {...} before giving up
+            start = response_text.find("{")
+            end = response_text.rfind("}")
+            if start != -1 and end > start:
+                try:
+                    return _json_loads(response_text[start : end + 1])
+                except json.JSONDecodeError:
+                    pass
+
+            # Don't keep serving an unparseable response from the cache
+            self.discard_cached(prompt, max_tokens, system)
             console.print(f"[red]Failed to parse JSON response: {e}[/red]")
             console.print(f"[dim]Response text: {response_text}[/dim]")
             raise ValueError(f"Invalid JSON response from Claude: {response_text}")
@@ -130,8 +318,6 @@ def is_api_available() -> bool:
     Returns:
         True if API key is set, False otherwise
     """
-    load_dotenv()
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    return (
-        api_key is not None and api_key.strip() != "" and api_key != "your_api_key_here"
-    )
+    # .env is loaded once at import; no need to re-read it on every check
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    return bool(api_key and api_key.strip() and api_key != "your_api_key_here")
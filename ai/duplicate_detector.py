@@ -1,18 +1,152 @@
 """Duplicate detection using semantic similarity with Claude AI."""
 
-from typing import Any, Dict, List
+import asyncio
+import hashlib
+import heapq
+import math
+import re
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set
 
 from rich.console import Console
 
-from ai.claude_client import get_client, is_api_available
+from ai.claude_client import get_client, is_api_available, truncate_for_prompt
+from utils.storage import load_quote_summaries
 
 console = Console()
 
+# Maximum number of similarity requests in flight at once
+SIMILARITY_WORKERS = 8
+
+# Maximum number of locally ranked candidates sent to Claude per check; they
+# are all compared in a single API call
+MAX_AI_CANDIDATES = 10
+
+# Candidates more than this many times longer or shorter than the new quote
+# are skipped; texts that different in length are never near-duplicates
+MAX_LENGTH_RATIO = 2.0
+
+_WORD_RE = re.compile(r"[\w']+")
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+
+@lru_cache(maxsize=4096)
+def _word_set(text: str) -> frozenset:
+    """Return the lowercased word set of a quote, cached by text."""
+    return frozenset(text.lower().split())
+
+
+@lru_cache(maxsize=4096)
+def _exact_key(text: str) -> bytes:
+    """Hash a quote with case, punctuation and spacing normalised away."""
+    canonical = " ".join(_PUNCTUATION_RE.sub("", text.lower()).split())
+    return hashlib.sha1(canonical.encode("utf-8"), usedforsecurity=False).digest()
+
+
+@lru_cache(maxsize=4096)
+def _unit_vector(text: str) -> Dict[str, float]:
+    """
+    Build an L2-normalised bag-of-words vector for a quote, cached by text.
+
+    Normalising up front means cosine similarity is a plain dot product.
+    """
+    counts = Counter(_WORD_RE.findall(text.lower()))
+    norm = math.sqrt(sum(count * count for count in counts.values()))
+    return {word: count / norm for word, count in counts.items()}
+
+
+def _cosine_similarity(vec1: Dict[str, float], vec2: Dict[str, float]) -> float:
+    """
+    Compute cosine similarity between two unit term vectors.
+
+    Args:
+        vec1: First unit vector
+        vec2: Second unit vector
+
+    Returns:
+        Similarity score (0.0-1.0)
+    """
+    if len(vec1) > len(vec2):
+        vec1, vec2 = vec2, vec1
+    dot = sum(weight * vec2.get(word, 0.0) for word, weight in vec1.items())
+    return min(1.0, dot)
+
+
+class _InvertedIndex:
+    """
+    Word -> quote id posting lists, kept in sync with the quote list.
+
+    Also maps each quote's normalised-text hash to its ids so exact
+    duplicates are found without any scan.
+    """
+
+    def __init__(self) -> None:
+        self.texts: Dict[str, str] = {}
+        self.postings: Dict[str, Set[str]] = {}
+        self.exact: Dict[bytes, Set[str]] = {}
+
+    def sync(self, quotes_by_id: Dict[str, Dict]) -> None:
+        """Incrementally apply added, edited and deleted quotes."""
+        stale = [
+            quote_id
+            for quote_id, text in self.texts.items()
+            if quote_id not in quotes_by_id
+            or quotes_by_id[quote_id].get("text", "") != text
+        ]
+        for quote_id in stale:
+            self._remove(quote_id)
+
+        for quote_id, quote in quotes_by_id.items():
+            if quote_id not in self.texts:
+                self._add(quote_id, quote.get("text", ""))
+
+    def overlaps(self, words: frozenset) -> Counter:
+        """Count how many of the given words each indexed quote contains."""
+        counts: Counter = Counter()
+        for word in words:
+            counts.update(self.postings.get(word, ()))
+        return counts
+
+    def exact_matches(self, text: str) -> Set[str]:
+        """Return ids of indexed quotes whose normalised text equals text's."""
+        return set(self.exact.get(_exact_key(text), ()))
+
+    def _add(self, quote_id: str, text: str) -> None:
+        self.texts[quote_id] = text
+        for word in _word_set(text):
+            self.postings.setdefault(word, set()).add(quote_id)
+        self.exact.setdefault(_exact_key(text), set()).add(quote_id)
+
+    def _remove(self, quote_id: str) -> None:
+        text = self.texts.pop(quote_id)
+        for word in _word_set(text):
+            _discard(self.postings, word, quote_id)
+        _discard(self.exact, _exact_key(text), quote_id)
+
+
+def _discard(postings: Dict, key: Any, quote_id: str) -> None:
+    """Remove an id from a posting set, dropping the set once it's empty."""
+    posting = postings.get(key)
+    if posting is not None:
+        posting.discard(quote_id)
+        if not posting:
+            del postings[key]
+
+
+# Shared across calls so only changed quotes are re-indexed
+_INDEX = _InvertedIndex()
+_INDEX_LOCK = threading.Lock()
+
 
 def check_similarity(quote1_text: str, quote2_text: str) -> Dict[str, Any]:
     """
     Check semantic similarity between two quotes.
 
+    A single-candidate wrapper around check_similarity_batch.
+
     Args:
         quote1_text: First quote text
         quote2_text: Second quote text
@@ -28,21 +162,61 @@ def check_similarity(quote1_text: str, quote2_text: str) -> Dict[str, Any]:
     if not is_api_available():
         raise ValueError("Claude API key not configured")
 
+    try:
+        return check_similarity_batch(quote1_text, [quote2_text])[0]
+
+    except Exception as e:
+        console.print(f"[yellow]Similarity check failed: {e}[/yellow]")
+        # Return fallback - assume not similar on error
+        return {"similarity": 0.0, "reason": "AI unavailable"}
+
+
+def check_similarity_batch(
+    new_quote_text: str, candidate_texts: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Check semantic similarity of one quote against several candidates at once.
+
+    Sends a single prompt listing every candidate so the whole batch costs one
+    API round-trip instead of one per candidate.
+
+    Args:
+        new_quote_text: The new quote text
+        candidate_texts: Existing quote texts to compare against
+
+    Returns:
+        List of {"similarity", "reason"} dictionaries, in the same order as
+        candidate_texts
+
+    Raises:
+        ValueError: If the response doesn't match the expected structure
+        Exception: If AI is unavailable or request fails
+    """
+    if not is_api_available():
+        raise ValueError("Claude API key not configured")
+
     client = get_client()
 
-    prompt = f"""Compare these two quotes for semantic similarity.
+    candidates_block = "\n".join(
+        f'Candidate {i}: """{truncate_for_prompt(text)}"""'
+        for i, text in enumerate(candidate_texts, 1)
+    )
+
+    prompt = f"""Compare the new quote against each numbered candidate for semantic similarity.
 Consider:
 - Same core message/meaning (high weight)
 - Similar wording or phrasing
 - Minor differences like punctuation, capitalization don't matter much
 
-Quote 1: \"\"\"{quote1_text}\"\"\"
-Quote 2: \"\"\"{quote2_text}\"\"\"
+New quote: \"\"\"{truncate_for_prompt(new_quote_text)}\"\"\"
+
+{candidates_block}
 
-Respond with ONLY a JSON object in this exact format:
+Respond with ONLY a JSON object in this exact format, with one entry per candidate:
 {{
-    "similarity": 0.85,
-    "reason": "brief explanation of similarity or difference"
+    "results": [
+        {{"index": 1, "similarity": 0.85, "reason": "brief explanation of similarity or difference"}}
+    ]
 }}
 
 Similarity scale:
@@ -53,35 +227,118 @@ Similarity scale:
 
 DO NOT include any text outside the JSON object."""
 
+    max_tokens = 300 * len(candidate_texts)
+    response = client.complete_json(prompt, max_tokens=max_tokens)
+
     try:
-        response = client.complete_json(prompt, max_tokens=300)
+        return _parse_batch_results(response, len(candidate_texts))
+    except ValueError:
+        # Don't keep replaying a malformed response from the cache
+        client.discard_cached(prompt, max_tokens)
+        raise
+
+
+def _parse_batch_results(response: Any, count: int) -> List[Dict[str, Any]]:
+    """
+    Validate a batch similarity response and put its results in order.
 
-        # Validate response structure
-        if not isinstance(response.get("similarity"), (int, float)):
-            raise ValueError("Response missing 'similarity' score")
+    Args:
+        response: Parsed JSON response from Claude
+        count: Number of candidates that were sent
+
+    Returns:
+        List of {"similarity", "reason"} dictionaries, one per candidate
 
-        return {
-            "similarity": float(response["similarity"]),
-            "reason": response.get("reason", ""),
+    Raises:
+        ValueError: If the response doesn't match the expected structure
+    """
+    entries = response.get("results") if isinstance(response, dict) else None
+    if not isinstance(entries, list):
+        raise ValueError("Response missing 'results' list")
+
+    # Candidates Claude doesn't mention are treated as different quotes
+    results = [{"similarity": 0.0, "reason": ""} for _ in range(count)]
+    for entry in entries:
+        index = entry.get("index") if isinstance(entry, dict) else None
+        if not isinstance(index, int) or not 1 <= index <= count:
+            raise ValueError(f"Invalid candidate index in response: {index!r}")
+        if not isinstance(entry.get("similarity"), (int, float)):
+            raise ValueError(f"Response missing 'similarity' for candidate {index}")
+        results[index - 1] = {
+            "similarity": float(entry["similarity"]),
+            "reason": entry.get("reason", ""),
         }
 
+    return results
+
+
+def _check_batch(new_quote_text: str, batch: List[Dict]) -> List[Dict[str, Any]]:
+    """
+    Compare a new quote against a batch of candidate quote dictionaries.
+
+    Tries a single batched request first. If that fails, falls back to one
+    check_similarity call per candidate, issued concurrently.
+
+    Args:
+        new_quote_text: The new quote text
+        batch: Candidate quote dictionaries
+
+    Returns:
+        List of {"similarity", "reason"} dictionaries, in the same order as batch
+    """
+    batch_texts = [q.get("text", "") for q in batch]
+
+    try:
+        return check_similarity_batch(new_quote_text, batch_texts)
     except Exception as e:
-        console.print(f"[yellow]Similarity check failed: {e}[/yellow]")
-        # Return fallback - assume not similar on error
-        return {"similarity": 0.0, "reason": "AI unavailable"}
+        console.print(
+            f"[dim]Batched similarity check failed, checking individually: {e}[/dim]"
+        )
+
+    with ThreadPoolExecutor(max_workers=SIMILARITY_WORKERS) as executor:
+        futures = [
+            executor.submit(check_similarity, new_quote_text, text)
+            for text in batch_texts
+        ]
+
+    results = []
+    for existing_quote, future in zip(batch, futures):
+        try:
+            results.append(future.result())
+        except Exception as e:
+            console.print(
+                f"[dim]Skipping similarity check for quote {existing_quote.get('id', 'unknown')}: {e}[/dim]"
+            )
+            results.append({"similarity": 0.0, "reason": ""})
+    return results
 
 
-def check_duplicates(new_quote_text: str, existing_quotes: List[Dict]) -> List[Dict]:
+def check_duplicates(
+    new_quote_text: str, existing_quotes: Optional[List[Dict]] = None
+) -> List[Dict]:
     """
     Check for duplicate or similar quotes in existing collection.
 
+    Exact duplicates (same text ignoring case, punctuation and spacing) are
+    found from a local hash index and returned without calling AI.
+
     This function optimizes by pre-filtering before calling AI:
-    - Only checks quotes with similar length (±30%)
+    - Only checks quotes within MAX_LENGTH_RATIO of the new quote's length
     - Only checks quotes with at least 3 common words
+    - Only sends the MAX_AI_CANDIDATES closest candidates (by local
+      term-vector cosine similarity) to Claude
+
+    Candidates come from a word -> quote id index kept in sync with the
+    collection, so only quotes sharing words with the new one are looked at.
+
+    Candidates that pass the pre-filters are compared in a single batched
+    API call. If that response can't be used, it falls back to concurrent
+    check_similarity calls, one per candidate.
 
     Args:
         new_quote_text: The new quote text to check
-        existing_quotes: List of existing quote dictionaries
+        existing_quotes: List of existing quote dictionaries (defaults to the
+            stored collection)
 
     Returns:
         List of similar quotes with similarity scores, sorted by similarity:
@@ -94,42 +351,81 @@ def check_duplicates(new_quote_text: str, existing_quotes: List[Dict]) -> List[D
         ]
         Only includes quotes with similarity >= 0.70
     """
+    if existing_quotes is None:
+        existing_quotes = load_quote_summaries()
+
+    new_words = _word_set(new_quote_text)
+    quotes_by_id = {
+        str(quote.get("id") or f"#{position}"): quote
+        for position, quote in enumerate(existing_quotes)
+    }
+
+    with _INDEX_LOCK:
+        _INDEX.sync(quotes_by_id)
+        exact_ids = _INDEX.exact_matches(new_quote_text)
+        # Pre-filter: Check for common words (minimum 3 words in common)
+        # This is a lightweight check to avoid expensive AI calls for completely different quotes
+        overlap_counts = _INDEX.overlaps(new_words)
+
+    # Re-pasted quotes don't need an AI round-trip; list them in collection
+    # order so the result is the same on every run
+    if exact_ids:
+        return [
+            {
+                "quote": quote,
+                "similarity": 1.0,
+                "reason": "Exact match",
+            }
+            for quote_id, quote in quotes_by_id.items()
+            if quote_id in exact_ids
+        ]
+
     if not is_api_available():
         console.print("[yellow]AI not available for duplicate detection[/yellow]")
         return []
 
-    new_words = set(new_quote_text.lower().split())
-    similar_quotes = []
-
-    for existing_quote in existing_quotes:
-        existing_text = existing_quote.get("text", "")
+    # Pre-filter: Skip quotes of very different length
+    new_length = len(new_quote_text)
+    min_length = new_length / MAX_LENGTH_RATIO
+    max_length = new_length * MAX_LENGTH_RATIO
+
+    candidates = [
+        quotes_by_id[quote_id]
+        for quote_id, count in overlap_counts.items()
+        if count >= 3
+        and min_length <= len(quotes_by_id[quote_id].get("text", "")) <= max_length
+    ]
+
+    # Rank candidates locally so only the closest ones cost an API call
+    if len(candidates) > MAX_AI_CANDIDATES:
+        new_vector = _unit_vector(new_quote_text)
+        candidates = heapq.nlargest(
+            MAX_AI_CANDIDATES,
+            candidates,
+            key=lambda q: _cosine_similarity(
+                new_vector, _unit_vector(q.get("text", ""))
+            ),
+        )
+
+    if not candidates:
+        return []
 
-        # Pre-filter: Check for common words (minimum 3 words in common)
-        # This is a lightweight check to avoid expensive AI calls for completely different quotes
-        existing_words = set(existing_text.lower().split())
-        common_words = new_words.intersection(existing_words)
-        if len(common_words) < 3:
-            continue
+    similar_quotes = []
 
-        # Passed pre-filters, do AI similarity check
-        try:
-            result = check_similarity(new_quote_text, existing_text)
-            similarity = result["similarity"]
-
-            # Only include if similarity >= 0.70
-            if similarity >= 0.70:
-                similar_quotes.append(
-                    {
-                        "quote": existing_quote,
-                        "similarity": similarity,
-                        "reason": result["reason"],
-                    }
-                )
-        except Exception as e:
-            console.print(
-                f"[dim]Skipping similarity check for quote {existing_quote.get('id', 'unknown')}: {e}[/dim]"
+    for existing_quote, result in zip(
+        candidates, _check_batch(new_quote_text, candidates)
+    ):
+        similarity = result["similarity"]
+
+        # Only include if similarity >= 0.70
+        if similarity >= 0.70:
+            similar_quotes.append(
+                {
+                    "quote": existing_quote,
+                    "similarity": similarity,
+                    "reason": result["reason"],
+                }
             )
-            continue
 
     # Sort by similarity (highest first)
     similar_quotes.sort(key=lambda x: x["similarity"], reverse=True)
@@ -137,6 +433,25 @@ def check_duplicates(new_quote_text: str, existing_quotes: List[Dict]) -> List[D
     return similar_quotes
 
 
+async def check_duplicates_async(
+    new_quote_text: str, existing_quotes: Optional[List[Dict]] = None
+) -> List[Dict]:
+    """
+    Run check_duplicates in a worker thread.
+
+    Lets callers overlap duplicate detection with other AI requests.
+
+    Args:
+        new_quote_text: The new quote text to check
+        existing_quotes: List of existing quote dictionaries (defaults to the
+            stored collection)
+
+    Returns:
+        Same list as check_duplicates
+    """
+    return await asyncio.to_thread(check_duplicates, new_quote_text, existing_quotes)
+
+
 def get_similarity_level(similarity: float) -> str:
     """
     Get human-readable similarity level.
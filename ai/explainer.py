@@ -1,20 +1,24 @@
 """Quote explanation using Claude AI."""
 
-from typing import Dict
+from typing import Callable, Dict, Optional
 
 from rich.console import Console
 
-from ai.claude_client import get_client, is_api_available
+from ai.claude_client import get_client, is_api_available, truncate_for_prompt
 
 console = Console()
 
 
-def explain_quote(quote_dict: Dict) -> str:
+def explain_quote(
+    quote_dict: Dict, on_chunk: Optional[Callable[[str], None]] = None
+) -> str:
     """
     Generate a deep, meaningful explanation of a quote.
 
     Args:
         quote_dict: Dictionary containing quote data (text, author, personal_note, etc.)
+        on_chunk: Optional callback; if given, the response is streamed and
+            called with each chunk of text as it arrives
 
     Returns:
         Formatted explanation text (200-400 words)
@@ -30,8 +34,9 @@ def explain_quote(quote_dict: Dict) -> str:
     # Build context
     quote_text = quote_dict.get("text", "")
     author = quote_dict.get("author", "Anonymous")
-    personal_note = quote_dict.get("personal_note", "")
-    source = quote_dict.get("source", "")
+    # The full quote is kept for explanation quality; only the extras are capped
+    personal_note = truncate_for_prompt(quote_dict.get("personal_note") or "", 500)
+    source = truncate_for_prompt(quote_dict.get("source") or "", 500)
 
     # Create prompt for deep explanation
     prompt = f"""Provide a thoughtful, insightful explanation of this quote.
@@ -62,7 +67,14 @@ Write in a conversational, accessible style. Be insightful and thought-provoking
 Do NOT just summarize or paraphrase the quote. Provide genuine insight and practical value."""
 
     try:
-        response = client.complete(prompt, max_tokens=800)
+        if on_chunk is None:
+            response = client.complete(prompt, max_tokens=800)
+        else:
+            chunks = []
+            for chunk in client.complete_stream(prompt, max_tokens=800):
+                chunks.append(chunk)
+                on_chunk(chunk)
+            response = "".join(chunks)
         return response.strip()
 
     except Exception as e:
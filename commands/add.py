@@ -1,26 +1,30 @@
 """Add quote command implementation."""
 
+import importlib.util
 import os
 import re
 import shlex
+import shutil
 import subprocess  # nosec B404
 import tempfile
-from datetime import datetime
-from typing import Optional
+import textwrap
+from typing import Any, List, Optional
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
+from rich.text import Text
 
-from ai.author_identifier import identify_author_enhanced
-from ai.categorizer import suggest_categories
-from ai.claude_client import is_api_available
-from ai.duplicate_detector import check_duplicates, get_similarity_level
-from models.quote import AIMetadata, Quote
+from models.quote import AIMetadata, Quote, utcnow_iso
 from utils.category_selector import select_categories
 from utils.display import display_success, display_warning, set_theme
-from utils.input_helpers import prompt_choice, prompt_continue, prompt_input
-from utils.storage import load_quotes, save_quotes
+from utils.input_helpers import (
+    prompt_choice,
+    prompt_confirm,
+    prompt_continue,
+    prompt_input,
+)
+from utils.storage import append_quote
 
 # Enable line editing (arrow keys) for input() where supported
 try:
@@ -35,14 +39,8 @@ except Exception:
     pass
 
 # Optional rich multiline editor with full cursor movement across lines
-PT_AVAILABLE = False
-try:
-    from prompt_toolkit import PromptSession  # type: ignore
-    from prompt_toolkit.key_binding import KeyBindings  # type: ignore
-
-    PT_AVAILABLE = True
-except Exception:
-    PT_AVAILABLE = False
+# (imported on first use; it's slow to load and most runs never need it)
+PT_AVAILABLE = importlib.util.find_spec("prompt_toolkit") is not None
 
 console = Console()
 
@@ -53,6 +51,20 @@ MAX_SOURCE_LENGTH = 1000
 MAX_NOTE_LENGTH = 5000
 MAX_CATEGORY_LENGTH = 50
 
+# Shown under each similar-quote panel during interactive add
+SIMILAR_QUOTE_OPTIONS = (
+    "\nOptions:\n"
+    "  [yellow]e[/yellow] - Edit the existing quote (recommended)\n"
+    "  [yellow]n[/yellow] - Add as new quote anyway\n"
+    "  [yellow]c[/yellow] - Cancel"
+)
+
+# Patterns used to clean up typed and pasted quote text
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F]")
+_ANSI_CSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+_CARET_NOTATION_RE = re.compile(r"\^\[\[[0-9;]*[~A-Za-z]")
+_BORDER_CHARS = ("│", "|")
+
 
 def _validate_input_length(text: str, max_length: int, field_name: str) -> bool:
     """Validate that input doesn't exceed maximum length.
@@ -86,7 +98,7 @@ def _sanitize_text(text: str) -> str:
     # Normalize line endings
     text = text.replace("\r\n", "\n").replace("\r", "\n")
     # Remove NULs and control chars except tab/newline
-    text = re.sub(r"[\x00-\x08\x0B\x0C\x0E-\x1F]", "", text)
+    text = _CONTROL_CHARS_RE.sub("", text)
     # Strip trailing whitespace per line
     text = "\n".join(line.rstrip() for line in text.split("\n"))
     # Remove a single trailing newline, but keep internal newlines
@@ -105,50 +117,52 @@ def _cleanup_pasted_text(text: str) -> str:
     """
     if not text:
         return ""
-    # Remove ANSI CSI sequences (e.g., ESC[31m, ESC[A)
-    text = re.sub(r"\x1b\[[0-9;]*[A-Za-z]", "", text)
+    # Remove ANSI CSI sequences (e.g., ESC[31m, ESC[A); typed text has none
+    if "\x1b" in text:
+        text = _ANSI_CSI_RE.sub("", text)
     # Remove caret-notation sequences like ^[[D, ^[[A, ^[[1;5C
-    text = re.sub(r"\^\[\[[0-9;]*[~A-Za-z]", "", text)
+    if "^[" in text:
+        text = _CARET_NOTATION_RE.sub("", text)
 
     lines = text.split("\n")
 
     # Detect and strip common left border (│ or |) for majority of lines
-    def strip_left_border(s: str) -> str:
-        return re.sub(r"^\s*[│|]\s?", "", s)
-
     def has_left_border(s: str) -> bool:
-        return re.match(r"^\s*[│|]\s?", s) is not None
+        return s.lstrip()[:1] in _BORDER_CHARS
 
-    non_empty = [ln for ln in lines if ln.strip()]
+    def strip_left_border(s: str) -> str:
+        rest = s.lstrip()
+        if rest[:1] not in _BORDER_CHARS:
+            return s
+        # Drop the border and at most one space of padding after it
+        return rest[2:] if rest[1:2].isspace() else rest[1:]
+
+    def strip_right_border(s: str) -> str:
+        rest = s.rstrip()
+        if rest[-1:] not in _BORDER_CHARS:
+            return s
+        return rest[:-1].rstrip()
+
+    non_empty = [ln for ln in lines if ln and not ln.isspace()]
     if non_empty:
         count_left = sum(1 for ln in non_empty if has_left_border(ln))
         if count_left >= max(1, int(0.6 * len(non_empty))):  # if majority
             lines = [strip_left_border(ln) for ln in lines]
 
-    # Strip right border if present
-    lines = [re.sub(r"\s*[│|]\s*$", "", ln) for ln in lines]
+    # Strip right border if present, then dedent by common leading whitespace
+    text = textwrap.dedent("\n".join(strip_right_border(ln) for ln in lines))
 
-    # Dedent by common leading whitespace across non-empty lines
-    non_empty = [ln for ln in lines if ln.strip()]
-    if non_empty:
-        # Compute min common indent
-        def leading_spaces(s: str) -> int:
-            return len(s) - len(s.lstrip(" "))
-
-        min_indent = min(leading_spaces(ln) for ln in non_empty)
-        if min_indent > 0:
-            lines = [ln[min_indent:] if len(ln) >= min_indent else ln for ln in lines]
+    # Re-trim trailing whitespace on each line, so blank lines become empty
+    lines = [ln.rstrip() for ln in text.split("\n")]
 
     # Trim leading/trailing blank lines
-    while lines and not lines[0].strip():
-        lines.pop(0)
-    while lines and not lines[-1].strip():
-        lines.pop()
-
-    # Re-trim trailing whitespace on each line
-    lines = [ln.rstrip() for ln in lines]
+    start, end = 0, len(lines)
+    while start < end and not lines[start]:
+        start += 1
+    while end > start and not lines[end - 1]:
+        end -= 1
 
-    return "\n".join(lines)
+    return "\n".join(lines[start:end])
 
 
 def _truthy(val: Optional[str]) -> bool:
@@ -157,15 +171,32 @@ def _truthy(val: Optional[str]) -> bool:
     return val.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _editor_command() -> Optional[List[str]]:
+    """Return $EDITOR (or nano) split into arguments, or None if not runnable.
+
+    Uses shlex.split to support commands like "code -w".
+    """
+    editor = os.environ.get("EDITOR", "nano").strip() or "nano"
+    try:
+        parts = shlex.split(editor)
+    except ValueError:
+        return None
+    if not parts or shutil.which(parts[0]) is None:
+        return None
+    return parts
+
+
 def _edit_in_editor(initial_text: str = "") -> str:
     """Open $EDITOR (or nano) to capture multi-line content.
 
     - Prefills a helpful header as comments that are removed on save.
     - Honors EDITOR env var; supports editors like 'code -w'.
+    - Falls back to the built-in multi-line input if the editor isn't found.
     """
-    editor = os.environ.get("EDITOR", "nano").strip()
-    if not editor:
-        editor = "nano"
+    editor_cmd = _editor_command()
+    if editor_cmd is None:
+        display_warning("Editor not found (check EDITOR); using built-in input")
+        return _read_multiline_input("Quote text (multi-line supported)")
 
     header = (
         "# Quotes Manager - Editor Input\n"
@@ -181,9 +212,8 @@ def _edit_in_editor(initial_text: str = "") -> str:
         tf.flush()
 
     try:
-        # Use shlex.split to support commands like "code -w"
         # Editor is from trusted env var EDITOR, path is controlled temp file
-        cmd = shlex.split(editor) + [path]
+        cmd = editor_cmd + [path]
         subprocess.run(cmd, check=True)  # nosec B603
         with open(path, "r", encoding="utf-8") as f:
             content = f.read()
@@ -213,6 +243,9 @@ def _read_multiline_input(prompt_title: str, sentinel: str = "END") -> str:
         )
 
         try:
+            from prompt_toolkit import PromptSession  # type: ignore
+            from prompt_toolkit.key_binding import KeyBindings  # type: ignore
+
             kb = KeyBindings()
 
             # Ctrl+D to finish
@@ -281,6 +314,43 @@ def _read_multiline_input(prompt_title: str, sentinel: str = "END") -> str:
     return text
 
 
+async def _analyze_quote(text: str, lookup_author: bool) -> List[Any]:
+    """
+    Run duplicate detection, category suggestion and author lookup concurrently.
+
+    The three calls are independent network round-trips, so the total wait is
+    the slowest call rather than their sum.
+
+    Args:
+        text: The quote text
+        lookup_author: Whether to identify the author
+
+    Returns:
+        [duplicates, categories, author] outcomes (author only if
+        lookup_author); a failed call's exception is returned in its place
+    """
+    import asyncio
+
+    from ai.author_identifier import identify_author_enhanced_async
+    from ai.categorizer import suggest_categories_async
+    from ai.duplicate_detector import check_duplicates_async
+
+    tasks = [
+        check_duplicates_async(text),
+        suggest_categories_async(text),
+    ]
+    if lookup_author:
+        tasks.append(identify_author_enhanced_async(text))
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _unwrap(outcome: Any) -> Any:
+    """Return a gathered result, re-raising it if the call failed."""
+    if isinstance(outcome, BaseException):
+        raise outcome
+    return outcome
+
+
 def add_quote(
     text: str = typer.Option(None, "--text", "-t", help="Quote text"),
     editor: bool = typer.Option(
@@ -319,7 +389,12 @@ def add_quote(
 
     # Initialize AI metadata
     ai_metadata = AIMetadata()
-    ai_available = is_api_available() and not skip_ai
+    if skip_ai:
+        ai_available = False
+    else:
+        from ai.claude_client import is_api_available
+
+        ai_available = is_api_available()
 
     if interactive_mode:
         # Full interactive mode
@@ -368,6 +443,12 @@ def add_quote(
 
         # AI Processing Phase
         if ai_available:
+            # AI modules are only imported when they're going to be used
+            import asyncio
+
+            from ai.author_identifier import split_attribution
+            from ai.duplicate_detector import get_similarity_level
+
             console.print()
 
             # Store results to display after processing
@@ -375,11 +456,32 @@ def add_quote(
             similar_quotes = []
             cat_result = None
 
+            lookup_author = not author_input or author_input.strip() == ""
+
+            # A pasted "... — Name" attribution saves the author lookup, but
+            # only if the user confirms it; the text is otherwise kept as typed
+            if lookup_author:
+                quote_body, attributed_author = split_attribution(text)
+                if attributed_author and len(attributed_author) <= MAX_AUTHOR_LENGTH:
+                    if prompt_confirm(
+                        f"The quote ends with an attribution. Use [bold]{attributed_author}[/bold] "
+                        "as the author and remove it from the quote text?",
+                        default=True,
+                    ):
+                        text = quote_body
+                        author_input = attributed_author
+                        lookup_author = False
+                    console.print()
+
             with console.status("🤔 Analyzing quote..."):
+                dup_outcome, cat_outcome, *author_outcome = asyncio.run(
+                    _analyze_quote(text.strip(), lookup_author)
+                )
+
                 # 1. Author identification (if not provided)
-                if not author_input or author_input.strip() == "":
+                if lookup_author:
                     try:
-                        author_result = identify_author_enhanced(text.strip())
+                        author_result = _unwrap(author_outcome[0])
                         author = author_result["author"]
                         ai_metadata.author_confidence = author_result["confidence"]
                     except Exception as e:
@@ -393,21 +495,16 @@ def add_quote(
                     author = author_input.strip()
 
                 # 2. Duplicate detection
-                existing_quotes = load_quotes()
-                existing_quote_dicts = [q.to_dict() for q in existing_quotes]
-
                 try:
-                    similar_quotes = check_duplicates(
-                        text.strip(), existing_quote_dicts
-                    )
-                    ai_metadata.duplicate_check_date = datetime.utcnow().isoformat()
+                    similar_quotes = _unwrap(dup_outcome)
+                    ai_metadata.duplicate_check_date = utcnow_iso()
                 except Exception as e:
                     console.print(f"\n[yellow]Duplicate detection error: {e}[/yellow]")
                     similar_quotes = []
 
                 # 3. Category suggestion
                 try:
-                    cat_result = suggest_categories(text.strip())
+                    cat_result = _unwrap(cat_outcome)
                     ai_metadata.suggested_categories = cat_result["suggested"]
                     ai_metadata.category_confidence = cat_result["confidence"]
                 except Exception:
@@ -439,32 +536,35 @@ def add_quote(
             if similar_quotes:
                 # Show similar quotes
                 console.print()
+                new_quote_text = text.strip()
                 for similar in similar_quotes[:3]:  # Show top 3
                     sim_quote = similar["quote"]
                     similarity = similar["similarity"]
                     level = get_similarity_level(similarity)
 
+                    # Plain Text, so quotes containing [brackets] aren't
+                    # parsed as markup
                     console.print(
                         Panel(
-                            f"[yellow]⚠️  Similar quote found ({similarity:.0%} match - {level})[/yellow]\n\n"
-                            f"Existing quote:\n"
-                            f'"{sim_quote["text"]}"\n'
-                            f'— {sim_quote["author"]}\n\n'
-                            f"Your quote:\n"
-                            f'"{text.strip()}"\n'
-                            f"— {author}\n\n"
-                            f'[dim]{similar["reason"]}[/dim]',
+                            Text.assemble(
+                                (
+                                    f"⚠️  Similar quote found ({similarity:.0%} match - {level})",
+                                    "yellow",
+                                ),
+                                "\n\nExisting quote:\n"
+                                f'"{sim_quote["text"]}"\n'
+                                f'— {sim_quote["author"]}\n\n'
+                                "Your quote:\n"
+                                f'"{new_quote_text}"\n'
+                                f"— {author}\n\n",
+                                (similar["reason"], "dim"),
+                            ),
                             border_style="yellow",
                         )
                     )
 
                     # Ask what to do
-                    console.print("\nOptions:")
-                    console.print(
-                        "  [yellow]e[/yellow] - Edit the existing quote (recommended)"
-                    )
-                    console.print("  [yellow]n[/yellow] - Add as new quote anyway")
-                    console.print("  [yellow]c[/yellow] - Cancel")
+                    console.print(SIMILAR_QUOTE_OPTIONS)
 
                     choice = prompt_choice(
                         "Choice: ", choices=["e", "n", "c"], default="e"
@@ -562,6 +662,8 @@ def add_quote(
 
         # In non-interactive mode, still do AI author lookup if no author provided
         if ai_available and author == "Anonymous":
+            from ai.author_identifier import identify_author_enhanced
+
             try:
                 author_result = identify_author_enhanced(text.strip())
                 if author_result["author"] != "Anonymous":
@@ -581,16 +683,16 @@ def add_quote(
     )
 
     # Save to storage
-    quotes = load_quotes()
-    quotes.append(quote)
-    save_quotes(quotes)
+    append_quote(quote)
 
     # Show success message
     console.print()
     display_success(f"Quote saved! (ID: {quote.id[:8]})")
 
-    # Show summary
-    console.print(f'\n"{quote.text}"', style="cyan")
-    console.print(f"— {quote.author}", style="dim white")
+    # Show summary as one plain Text, so no markup parsing of user text
+    summary = Text()
+    summary.append(f'\n"{quote.text}"\n', style="cyan")
+    summary.append(f"— {quote.author}", style="dim white")
     if quote.categories:
-        console.print(f"Categories: {', '.join(quote.categories)}", style="blue")
+        summary.append(f"\nCategories: {', '.join(quote.categories)}", style="blue")
+    console.print(summary)
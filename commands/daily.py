@@ -1,27 +1,56 @@
 """Daily quote command implementation."""
 
 import random
-import sys
-from datetime import datetime
-from typing import Optional
+import time
+from typing import AbstractSet, List, Optional
 
 import typer
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.text import Text
 
 from models.quote import Quote
 from utils.display import display_warning, set_theme
 from utils.storage import (
-    add_to_display_history,
     get_display_history,
     get_last_daily_display,
+    get_quote_by_id,
+    get_recently_shown_ids,
     load_quotes,
-    save_quotes,
+    update_quote_shown,
 )
 
 console = Console()
 
+# Random draws tried before falling back to filtering the whole collection
+PICK_ATTEMPTS = 8
+
+
+def _pick_quote(quotes: List[Quote], recently_shown_ids: AbstractSet[str]) -> Quote:
+    """
+    Pick a random quote, avoiding recently shown ones where possible.
+
+    The history holds at most 21 entries, so in a larger collection a few
+    random draws almost always land on an eligible quote without building a
+    filtered copy of the list.
+
+    Args:
+        quotes: All quotes (non-empty)
+        recently_shown_ids: IDs of quotes to avoid
+
+    Returns:
+        A quote not recently shown, or any quote if all were shown recently
+    """
+    if len(quotes) > 2 * len(recently_shown_ids):
+        for _ in range(PICK_ATTEMPTS):
+            quote = random.choice(quotes)
+            if quote.id not in recently_shown_ids:
+                return quote
+
+    # Filter out recently shown quotes (or use all if every one was shown)
+    available_quotes = [q for q in quotes if q.id not in recently_shown_ids] or quotes
+    return random.choice(available_quotes)
+
 
 def get_daily_quote(force: bool = False) -> Optional[Quote]:
     """
@@ -33,54 +62,32 @@ def get_daily_quote(force: bool = False) -> Optional[Quote]:
     Returns:
         Quote object or None if no quotes available
     """
+    # Check if we've already shown a quote today; the stored timestamp is
+    # local time, so its date prefix compares directly with today's date
+    last_display = get_last_daily_display()
+    today = time.strftime("%Y-%m-%d")
+
+    if not force and isinstance(last_display, str) and last_display[:10] == today:
+        # Already shown today, find and return that quote
+        display_history = get_display_history()
+        if display_history:
+            quote = get_quote_by_id(display_history[-1].get("quote_id", ""))
+            if quote:
+                return quote
+
     quotes = load_quotes()
 
     if not quotes:
         return None
 
-    # Check if we've already shown a quote today
-    last_display = get_last_daily_display()
+    # Avoid quotes from the last 21 days of display history
+    recently_shown_ids = get_recently_shown_ids()
 
-    if last_display and not force:
-        try:
-            last_display_date = datetime.fromisoformat(last_display).date()
-            today = datetime.now().date()  # Use local time, not UTC
-
-            if last_display_date == today:
-                # Already shown today, find and return that quote
-                display_history = get_display_history()
-                if display_history:
-                    last_quote_id = display_history[-1]["quote_id"]
-                    for quote in quotes:
-                        if quote.id == last_quote_id:
-                            return quote
-        except Exception:
-            pass
-
-    # Get display history for last 21 days
-    display_history = get_display_history()
-    recently_shown_ids = {entry["quote_id"] for entry in display_history}
-
-    # Filter out recently shown quotes
-    available_quotes = [q for q in quotes if q.id not in recently_shown_ids]
-
-    # If all quotes have been shown recently, use all quotes
-    if not available_quotes:
-        available_quotes = quotes
-
-    # Select random quote
-    quote = random.choice(available_quotes)
-
-    # Mark as shown and update display history
-    quote.mark_shown()
-    add_to_display_history(quote.id)
+    quote = _pick_quote(quotes, recently_shown_ids)
 
-    # Save updated quote
-    for i, q in enumerate(quotes):
-        if q.id == quote.id:
-            quotes[i] = quote
-            break
-    save_quotes(quotes)
+    # Mark as shown, then store just that quote's counters and the history
+    quote.mark_shown()
+    update_quote_shown(quote.id, quote.last_shown)
 
     return quote
 
@@ -102,27 +109,6 @@ def show_daily(
     Shows a different quote each day, with no repeats within 21 days.
     Use --quiet for a minimal display suitable for shell startup.
     """
-    # Handle Typer boolean flag parsing
-    # Typer converts False to string 'False' for boolean options
-    # Check if it's a string and convert it, or if it's None, check sys.argv
-    if isinstance(quiet, str):
-        quiet = (
-            quiet.lower() in ("true", "1", "yes")
-            or "--quiet" in sys.argv
-            or "-q" in sys.argv
-        )
-    elif quiet is None:
-        quiet = "--quiet" in sys.argv or "-q" in sys.argv
-
-    if isinstance(force, str):
-        force = (
-            force.lower() in ("true", "1", "yes")
-            or "--force" in sys.argv
-            or "-f" in sys.argv
-        )
-    elif force is None:
-        force = "--force" in sys.argv or "-f" in sys.argv
-
     # Set theme if provided
     if theme:
         set_theme(theme)
@@ -135,16 +121,13 @@ def show_daily(
         return
 
     if quiet:
-        # Minimal display for shell startup
-        console.print()
-        console.print(f'  "{quote.text}"', style="cyan")
-        console.print(f"  — {quote.author}", style="dim white")
-        console.print()
+        # Minimal display for shell startup, written in a single call
+        quote_text = Text()
+        quote_text.append(f'\n  "{quote.text}"\n', style="cyan")
+        quote_text.append(f"  — {quote.author}\n", style="dim white")
+        console.print(quote_text)
     else:
-        # Full display with details
-        console.print()
-
-        # Create quote panel
+        # Full display with details, rendered in a single print
         quote_text = Text()
         quote_text.append(f'"{quote.text}"\n\n', style="cyan")
         quote_text.append(f"— {quote.author}", style="dim white")
@@ -155,19 +138,21 @@ def show_daily(
             border_style="cyan",
             padding=(1, 2),
         )
-        console.print(panel)
+        lines: List[RenderableType] = ["", panel, ""]
 
         # Show metadata
-        console.print()
         if quote.categories:
-            console.print(
-                f"  [dim]Categories:[/dim] {', '.join(quote.categories)}",
-                style="blue",
+            lines.append(
+                Text.from_markup(
+                    f"  [dim]Categories:[/dim] {', '.join(quote.categories)}",
+                    style="blue",
+                )
             )
         if quote.source:
-            console.print(f"  [dim]Source:[/dim] {quote.source}")
+            lines.append(f"  [dim]Source:[/dim] {quote.source}")
 
-        console.print(
+        lines.append(
             f"  [dim]Quote #{quote.id[:8]} | Shown {quote.times_shown} time{'s' if quote.times_shown != 1 else ''}[/dim]"
         )
-        console.print()
+        lines.append("")
+        console.print(Group(*lines))
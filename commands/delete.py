@@ -4,14 +4,17 @@ import typer
 from rich.console import Console
 from rich.prompt import Confirm
 
-from utils.display import display_error, display_success, display_warning, set_theme
-from utils.storage import (
-    delete_quote as storage_delete_quote,
+from utils.display import (
+    display_error,
+    display_id_matches,
+    display_success,
+    display_warning,
+    set_theme,
 )
 from utils.storage import (
-    get_quote_by_id,
-    load_quotes,
+    delete_quote as storage_delete_quote,
 )
+from utils.storage import resolve_quote_id
 
 console = Console()
 
@@ -38,40 +41,22 @@ def delete_quote_command(
         set_theme(theme)
 
     # Find quote by full or partial ID
-    quotes = load_quotes()
-
-    # Try exact match first
-    quote = get_quote_by_id(quote_id)
-
-    # If not found, try partial match
+    quote, matches = resolve_quote_id(quote_id)
     if not quote:
-        matching_quotes = [q for q in quotes if q.id.startswith(quote_id)]
-
-        if len(matching_quotes) == 0:
-            display_error(f"No quote found with ID '{quote_id}'")
-            console.print(
-                "\n[dim]Use 'quotes list' to see all quotes and their IDs[/dim]"
-            )
-            raise typer.Exit(1)
-        elif len(matching_quotes) > 1:
-            display_error(
-                f"Multiple quotes match '{quote_id}'. Please be more specific:"
-            )
-            for q in matching_quotes:
-                console.print(f'  - {q.id[:8]}: "{q.text[:50]}..."')
-            raise typer.Exit(1)
-        else:
-            quote = matching_quotes[0]
+        display_id_matches(quote_id, matches)
+        raise typer.Exit(1)
 
-    # Show quote to be deleted
+    # Show quote to be deleted (display_warning prints through the display
+    # module's console, so only the lines after it are buffered together)
     console.print()
     display_warning("Are you sure you want to delete this quote?")
-    console.print()
-    console.print(f'  "{quote.text}"', style="cyan")
-    console.print(f"  — {quote.author}", style="dim white")
-    console.print()
-    console.print("[red]This cannot be undone![/red]")
-    console.print()
+    with console:
+        console.print()
+        console.print(f'  "{quote.text}"', style="cyan")
+        console.print(f"  — {quote.author}", style="dim white")
+        console.print()
+        console.print("[red]This cannot be undone![/red]")
+        console.print()
 
     # Ask for confirmation unless --force flag is used
     if not force:
@@ -1,23 +1,19 @@
 """Edit quote command implementation."""
 
-import os
-
-# Import the multiline input function from add.py
-import sys
-
 import typer
 from rich.console import Console
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+# Reuse the multiline input and sanitising from add.py
 from commands.add import _read_multiline_input, _sanitize_text
 from utils.display import (
     display_error,
+    display_id_matches,
     display_quote_detailed,
     display_success,
     set_theme,
 )
 from utils.input_helpers import prompt_choice, prompt_input
-from utils.storage import get_quote_by_id, load_quotes, update_quote
+from utils.storage import resolve_quote_id, update_quote
 
 console = Console()
 
@@ -36,36 +32,19 @@ def edit_quote(
     Example:
         quotes edit a1b2c3d4
         quotes edit a1b2     # Partial ID works too
+
+    Returns:
+        The updated quote, or None if the edit was cancelled
     """
     # Set theme if provided
     if theme:
         set_theme(theme)
 
     # Find quote by full or partial ID
-    quotes = load_quotes()
-
-    # Try exact match first
-    quote = get_quote_by_id(quote_id)
-
-    # If not found, try partial match
+    quote, matches = resolve_quote_id(quote_id)
     if not quote:
-        matching_quotes = [q for q in quotes if q.id.startswith(quote_id)]
-
-        if len(matching_quotes) == 0:
-            display_error(f"No quote found with ID '{quote_id}'")
-            console.print(
-                "\n[dim]Use 'quotes list' to see all quotes and their IDs[/dim]"
-            )
-            raise typer.Exit(1)
-        elif len(matching_quotes) > 1:
-            display_error(
-                f"Multiple quotes match '{quote_id}'. Please be more specific:"
-            )
-            for q in matching_quotes:
-                console.print(f'  - {q.id[:8]}: "{q.text[:50]}..."')
-            raise typer.Exit(1)
-        else:
-            quote = matching_quotes[0]
+        display_id_matches(quote_id, matches)
+        raise typer.Exit(1)
 
     # Show current quote
     console.print("\n[bold cyan]Current quote:[/bold cyan]\n")
@@ -86,7 +65,7 @@ def edit_quote(
 
     if choice == "x":
         console.print("\nEdit cancelled")
-        return
+        return None
 
     # Edit based on choice
     if choice == "t":
@@ -147,6 +126,7 @@ def edit_quote(
         # Show updated quote
         console.print()
         display_quote_detailed(quote)
+        return quote
     else:
         display_error("Failed to update quote")
         raise typer.Exit(1)
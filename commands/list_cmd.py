@@ -4,7 +4,7 @@ import typer
 from rich.console import Console
 
 from utils.display import display_quote_list, display_warning, set_theme
-from utils.storage import load_quotes
+from utils.storage import count_quotes, load_newest_quotes, load_quotes
 
 console = Console()
 
@@ -31,56 +31,54 @@ def list_quotes(
     if theme:
         set_theme(theme)
 
-    quotes = load_quotes()
-
-    if not quotes:
+    if not count_quotes():
         display_warning("No quotes found. Add your first quote with 'quotes add'")
         return
 
-    # Apply filters
-    filtered_quotes = quotes
+    if category or author:
+        # Filtering needs every quote
+        filtered_quotes = load_quotes()
 
-    if category:
-        filtered_quotes = [
-            q
-            for q in filtered_quotes
-            if category.lower() in [c.lower() for c in q.categories]
-        ]
-        if not filtered_quotes:
-            display_warning(f"No quotes found in category '{category}'")
-            return
+        if category:
+            category_lower = category.lower()
+            filtered_quotes = [
+                q
+                for q in filtered_quotes
+                if any(c.lower() == category_lower for c in q.categories)
+            ]
+            if not filtered_quotes:
+                display_warning(f"No quotes found in category '{category}'")
+                return
 
-    if author:
-        filtered_quotes = [
-            q for q in filtered_quotes if author.lower() in q.author.lower()
-        ]
-        if not filtered_quotes:
-            display_warning(f"No quotes found by author '{author}'")
-            return
+        if author:
+            author_lower = author.lower()
+            filtered_quotes = [
+                q for q in filtered_quotes if author_lower in q.author.lower()
+            ]
+            if not filtered_quotes:
+                display_warning(f"No quotes found by author '{author}'")
+                return
 
-    # Sort by date added (newest first)
-    filtered_quotes.sort(key=lambda q: q.date_added, reverse=True)
+        # Sort by date added (newest first)
+        filtered_quotes.sort(key=lambda q: q.date_added, reverse=True)
+        total = len(filtered_quotes)
+    else:
+        # Unfiltered, only the quotes that will be shown need loading
+        filtered_quotes = load_newest_quotes(None if all else limit)
+        total = count_quotes()
 
     # Display results
     if category:
-        console.print(
-            f"\n[bold cyan]{len(filtered_quotes)} quote(s) in '{category}':[/bold cyan]\n"
-        )
+        console.print(f"\n[bold cyan]{total} quote(s) in '{category}':[/bold cyan]\n")
     elif author:
-        console.print(
-            f"\n[bold cyan]{len(filtered_quotes)} quote(s) by {author}:[/bold cyan]\n"
-        )
+        console.print(f"\n[bold cyan]{total} quote(s) by {author}:[/bold cyan]\n")
     else:
-        console.print(
-            f"\n[bold cyan]All quotes ({len(filtered_quotes)} total):[/bold cyan]\n"
-        )
+        console.print(f"\n[bold cyan]All quotes ({total} total):[/bold cyan]\n")
 
     # Display with limit unless --all flag is set
-    max_display = len(filtered_quotes) if all else limit
-    display_quote_list(filtered_quotes, max_display=max_display)
+    max_display = total if all else limit
+    display_quote_list(filtered_quotes, max_display=max_display, total=total)
 
     # Show tip if results were limited
-    if not all and len(filtered_quotes) > limit:
-        console.print(
-            f"\n[dim]Use --all to see all {len(filtered_quotes)} quotes[/dim]"
-        )
+    if not all and total > limit:
+        console.print(f"\n[dim]Use --all to see all {total} quotes[/dim]")
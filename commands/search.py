@@ -3,8 +3,13 @@
 import typer
 from rich.console import Console
 
-from utils.display import display_search_results, display_warning, set_theme
-from utils.storage import load_quotes
+from utils.display import (
+    display_error,
+    display_search_results,
+    display_warning,
+    set_theme,
+)
+from utils.storage import SEARCH_MODES, count_quotes, find_quotes
 
 console = Console()
 
@@ -14,6 +19,12 @@ def search_quotes(
     case_sensitive: bool = typer.Option(
         False, "--case-sensitive", "-c", help="Case-sensitive search"
     ),
+    mode: str = typer.Option(
+        "phrase",
+        "--mode",
+        "-m",
+        help="Match the exact phrase, any word, or all words: phrase, any, all",
+    ),
     theme: str = typer.Option(
         None, "--theme", help="Color theme: auto, dark, light, high-contrast, none"
     ),
@@ -27,41 +38,24 @@ def search_quotes(
         quotes search "passion"
         quotes search "steve jobs"
         quotes search "work life" --case-sensitive
+        quotes search "work life" --mode all   # Both words, anywhere
     """
     # Set theme if provided
     if theme:
         set_theme(theme)
 
-    quotes = load_quotes()
+    if mode not in SEARCH_MODES:
+        display_error(
+            f"Unknown search mode '{mode}' (choose from {', '.join(SEARCH_MODES)})"
+        )
+        raise typer.Exit(1)
 
-    if not quotes:
+    if not count_quotes():
         display_warning("No quotes found. Add your first quote with 'quotes add'")
         return
 
-    # Prepare search query
-    search_query = query if case_sensitive else query.lower()
-
-    # Search through all quote fields
-    matching_quotes = []
-
-    for quote in quotes:
-        # Build searchable text from all fields
-        searchable_fields = [
-            quote.text,
-            quote.author,
-            quote.source,
-            quote.personal_note,
-            " ".join(quote.categories),
-        ]
-
-        searchable_text = " ".join(searchable_fields)
-
-        if not case_sensitive:
-            searchable_text = searchable_text.lower()
-
-        # Check if query matches
-        if search_query in searchable_text:
-            matching_quotes.append(quote)
+    # Search through all quote fields (text, author, source, note, categories)
+    matching_quotes = find_quotes(query, case_sensitive=case_sensitive, mode=mode)
 
     # Display results
     display_search_results(matching_quotes, query)
@@ -10,6 +10,16 @@ from utils.themes import THEMES, get_color
 
 console = Console()
 
+# Menu number, theme name and description for the interactive selector
+THEME_OPTIONS = (
+    ("1", "auto", "Adapts to your terminal (default)"),
+    ("2", "dark", "Bright colors for dark backgrounds"),
+    ("3", "light", "Darker colors for light backgrounds"),
+    ("4", "high-contrast", "Maximum contrast for accessibility"),
+    ("5", "none", "Plain text, no colors"),
+)
+THEME_CHOICES = {num: name for num, name, _ in THEME_OPTIONS}
+
 
 def change_theme_interactive():
     """Interactive theme selection for menu mode."""
@@ -25,15 +35,7 @@ def change_theme_interactive():
     table.add_column("Description", style="default")
     table.add_column("Current", style="green", width=8)
 
-    themes_list = [
-        ("1", "auto", "Adapts to your terminal (default)"),
-        ("2", "dark", "Bright colors for dark backgrounds"),
-        ("3", "light", "Darker colors for light backgrounds"),
-        ("4", "high-contrast", "Maximum contrast for accessibility"),
-        ("5", "none", "Plain text, no colors"),
-    ]
-
-    for num, name, desc in themes_list:
+    for num, name, desc in THEME_OPTIONS:
         current_mark = "✓" if name == current_name else ""
         table.add_row(num, name, desc, current_mark)
 
@@ -43,43 +45,37 @@ def change_theme_interactive():
     # Get selection
     choice = prompt_choice(
         "[bold yellow]Select theme:[/bold yellow] ",
-        choices=["1", "2", "3", "4", "5"],
+        choices=list(THEME_CHOICES),
         default="1",
     )
 
     # Map choice to theme name
-    theme_map = {
-        "1": "auto",
-        "2": "dark",
-        "3": "light",
-        "4": "high-contrast",
-        "5": "none",
-    }
-
-    selected_theme = theme_map[choice]
+    selected_theme = THEME_CHOICES[choice]
 
     # Apply theme
     set_theme(selected_theme)
 
-    # Show confirmation with example
-    console.print(
-        f"\n[green]✓[/green] Theme changed to [bold cyan]{selected_theme}[/bold cyan]"
-    )
+    # Buffer the confirmation and preview so they reach the terminal in one write
+    with console:
+        # Show confirmation with example
+        console.print(
+            f"\n[green]✓[/green] Theme changed to [bold cyan]{selected_theme}[/bold cyan]"
+        )
 
-    # Show a preview of the new colors
-    console.print("\n[dim]Preview of colors:[/dim]")
-    console.print("  Primary:  ", end="")
-    console.print("██████████████████████████", style=get_color("primary"))
-    console.print("  Success:  ", end="")
-    console.print("██████████████████████████", style=get_color("success"))
-    console.print("  Warning:  ", end="")
-    console.print("██████████████████████████", style=get_color("warning"))
-    console.print("  Error:    ", end="")
-    console.print("██████████████████████████", style=get_color("error"))
-
-    console.print(
-        "\n[dim]Theme will apply to all menu operations until you exit.[/dim]"
-    )
+        # Show a preview of the new colors
+        console.print("\n[dim]Preview of colors:[/dim]")
+        console.print("  Primary:  ", end="")
+        console.print("██████████████████████████", style=get_color("primary"))
+        console.print("  Success:  ", end="")
+        console.print("██████████████████████████", style=get_color("success"))
+        console.print("  Warning:  ", end="")
+        console.print("██████████████████████████", style=get_color("warning"))
+        console.print("  Error:    ", end="")
+        console.print("██████████████████████████", style=get_color("error"))
+
+        console.print(
+            "\n[dim]Theme will apply to all menu operations until you exit.[/dim]"
+        )
 
 
 def change_theme_command(
@@ -6,14 +6,26 @@ from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.prompt import Confirm
 
-from ai.claude_client import is_api_available
-from ai.explainer import explain_quote
-from utils.display import display_error, display_quote_detailed, set_theme
+from utils.display import display_id_matches, display_quote_detailed, set_theme
 from utils.input_helpers import prompt_choice
-from utils.storage import get_quote_by_id, load_quotes, update_quote
+from utils.storage import resolve_quote_id, update_quote
 
 console = Console()
 
+# Interactive option menus and valid choices, keyed by whether AI is available
+_OPTION_LINES = (
+    "  [yellow]ed[/yellow] - Edit this quote",
+    "  [yellow]d[/yellow] - Delete this quote",
+    "  [yellow]b[/yellow] - Back to menu",
+)
+OPTIONS_TEXT = {
+    True: "\n".join(
+        ("  [yellow]e[/yellow] - Explain this quote (AI)",) + _OPTION_LINES
+    ),
+    False: "\n".join(("  [dim]e - Explain (AI unavailable)[/dim]",) + _OPTION_LINES),
+}
+OPTION_CHOICES = {True: ["e", "ed", "d", "b"], False: ["ed", "d", "b"]}
+
 
 def view_quote(
     quote_id: str = typer.Argument(..., help="Quote ID to view (full or partial)"),
@@ -39,42 +51,26 @@ def view_quote(
         set_theme(theme)
 
     # Find quote by full or partial ID
-    quotes = load_quotes()
-
-    # Try exact match first
-    quote = get_quote_by_id(quote_id)
-
-    # If not found, try partial match
+    quote, matches = resolve_quote_id(quote_id)
     if not quote:
-        matching_quotes = [q for q in quotes if q.id.startswith(quote_id)]
-
-        if len(matching_quotes) == 0:
-            display_error(f"No quote found with ID '{quote_id}'")
-            console.print(
-                "\n[dim]Use 'quotes list' to see all quotes and their IDs[/dim]"
-            )
-            raise typer.Exit(1)
-        elif len(matching_quotes) > 1:
-            display_error(
-                f"Multiple quotes match '{quote_id}'. Please be more specific:"
-            )
-            for q in matching_quotes:
-                console.print(f'  - {q.id[:8]}: "{q.text[:50]}..."')
-            raise typer.Exit(1)
-        else:
-            quote = matching_quotes[0]
+        display_id_matches(quote_id, matches)
+        raise typer.Exit(1)
 
     # Display quote details
     console.print()
     display_quote_detailed(quote)
 
     # Show AI explanation if requested
-    if explain and is_api_available():
-        show_explanation(quote)
-    elif explain and not is_api_available():
-        console.print(
-            "\n[yellow]AI explanation unavailable (no API key configured)[/yellow]"
-        )
+    if explain:
+        # AI modules are only imported when they're going to be used
+        from ai.claude_client import is_api_available
+
+        if is_api_available():
+            show_explanation(quote)
+        else:
+            console.print(
+                "\n[yellow]AI explanation unavailable (no API key configured)[/yellow]"
+            )
 
     # Interactive options (only if not run from command line with --explain)
     if not explain:
@@ -84,54 +80,59 @@ def view_quote(
 
 def show_explanation(quote):
     """Show AI-generated explanation for a quote."""
+    from rich.live import Live
+
+    from ai.explainer import explain_quote
+
     console.print()
-    with console.status("🤔 Generating explanation..."):
-        try:
-            explanation = explain_quote(quote.to_dict())
 
-            console.print()
-            console.print(
-                Panel(
-                    Markdown(explanation),
-                    title="[bold cyan]💡 AI Explanation[/bold cyan]",
-                    border_style="cyan",
-                    padding=(1, 2),
-                )
-            )
-            return explanation
+    def explanation_panel(text):
+        return Panel(
+            Markdown(text) if text else "[dim]🤔 Generating explanation...[/dim]",
+            title="[bold cyan]💡 AI Explanation[/bold cyan]",
+            border_style="cyan",
+            padding=(1, 2),
+        )
+
+    # Stream the explanation into a live panel, then print the final version
+    streamed = []
+    try:
+        with Live(
+            explanation_panel(""),
+            console=console,
+            refresh_per_second=8,
+            transient=True,
+        ) as live:
+
+            def on_chunk(chunk):
+                streamed.append(chunk)
+                live.update(explanation_panel("".join(streamed)))
 
-        except Exception as e:
-            console.print(f"\n[yellow]Explanation unavailable: {e}[/yellow]")
-            return None
+            explanation = explain_quote(quote.to_dict(), on_chunk=on_chunk)
+
+    except Exception as e:
+        console.print(f"\n[yellow]Explanation unavailable: {e}[/yellow]")
+        return None
+
+    console.print(explanation_panel(explanation))
+    return explanation
 
 
 def show_interactive_options(quote):
     """Show interactive options for viewing a quote."""
     # Import here to avoid circular imports
+    from ai.claude_client import is_api_available
     from commands.delete import delete_quote_command
     from commands.edit import edit_quote
 
     # Check if AI is available
     ai_available = is_api_available()
 
-    while True:
-        # Build options
-        options_text = "\n".join(
-            [
-                (
-                    "  [yellow]e[/yellow] - Explain this quote (AI)"
-                    if ai_available
-                    else "  [dim]e - Explain (AI unavailable)[/dim]"
-                ),
-                "  [yellow]ed[/yellow] - Edit this quote",
-                "  [yellow]d[/yellow] - Delete this quote",
-                "  [yellow]b[/yellow] - Back to menu",
-            ]
-        )
+    options_text = OPTIONS_TEXT[ai_available]
+    choices = OPTION_CHOICES[ai_available]
 
+    while True:
         console.print(f"{options_text}\n")
-
-        choices = ["e", "ed", "d", "b"] if ai_available else ["ed", "d", "b"]
         choice = prompt_choice("Choice: ", choices=choices, default="b")
 
         if choice == "b":
@@ -170,11 +171,8 @@ def show_interactive_options(quote):
             # Edit the quote
             console.print()
             try:
-                edit_quote(quote_id=quote.id, theme=None)
-                # After editing, reload the quote to show updated details
-                from utils.storage import get_quote_by_id
-
-                updated_quote = get_quote_by_id(quote.id)
+                # edit_quote returns the saved quote, so no reload is needed
+                updated_quote = edit_quote(quote_id=quote.id, theme=None)
                 if updated_quote:
                     quote = updated_quote
                     console.print()
@@ -16,7 +16,7 @@ from commands.edit import edit_quote
 from commands.list_cmd import list_quotes
 from commands.search import search_quotes
 from commands.setup_shell import setup_shell
-from commands.theme import change_theme_command
+from commands.theme import change_theme_command, change_theme_interactive
 from commands.view import view_quote
 from utils.input_helpers import prompt_continue, prompt_input
 from utils.menu import display_menu, get_menu_choice
@@ -66,6 +66,85 @@ def main(
     run_interactive_menu()
 
 
+def _press_enter(prefix: str = "\n") -> None:
+    """Wait for Enter before returning to the menu."""
+    # Looked up per call, since the theme can change between menu actions
+    dim_style = get_color("dim")
+    prompt_continue(f"{prefix}[{dim_style}]Press Enter to continue[/{dim_style}]")
+
+
+def _prompt_menu_input(label: str) -> str:
+    """Prompt for a value in the menu's primary style."""
+    prompt_style = f"bold {get_color('primary')}"
+    return prompt_input(f"[{prompt_style}]{label}[/{prompt_style}] ")
+
+
+def _menu_add():
+    """Add new quote."""
+    add_quote(
+        text=None,
+        editor=False,
+        author=None,
+        source=None,
+        note=None,
+        categories=None,
+        skip_ai=False,
+        theme=None,
+    )
+
+
+def _menu_daily():
+    """View daily quote."""
+    show_daily(quiet=False, force=False, theme=None)
+
+
+def _menu_list():
+    """List all quotes."""
+    list_quotes(category=None, author=None, limit=10, all=True, theme=None)
+
+
+def _menu_search():
+    """Search quotes."""
+    query = _prompt_menu_input("Search query:")
+    if query:
+        search_quotes(query=query, case_sensitive=False, mode="phrase", theme=None)
+
+
+def _menu_view():
+    """View quote details."""
+    quote_id = _prompt_menu_input("Enter quote ID:")
+    if quote_id:
+        view_quote(quote_id=quote_id, explain=False, theme=None)
+
+
+def _menu_edit():
+    """Edit quote."""
+    quote_id = _prompt_menu_input("Enter quote ID to edit:")
+    if quote_id:
+        edit_quote(quote_id=quote_id, theme=None)
+
+
+def _menu_delete():
+    """Delete quote."""
+    quote_id = _prompt_menu_input("Enter quote ID to delete:")
+    if quote_id:
+        delete_quote_command(quote_id=quote_id, force=False, theme=None)
+
+
+# Menu choice -> action; "0" (exit) is handled by the loop itself
+MENU_ACTIONS = {
+    "1": _menu_add,
+    "2": _menu_daily,
+    "3": _menu_list,
+    "4": _menu_search,
+    "5": _menu_view,
+    "6": _menu_edit,
+    "7": _menu_delete,
+    "8": setup_shell,
+    "9": change_theme_interactive,
+}
+
+
 def run_interactive_menu():
     """Run the interactive menu loop."""
     while True:
@@ -78,97 +157,11 @@ def run_interactive_menu():
                 console.print(f"\n[{goodbye_style}]Goodbye! 📖✨[/{goodbye_style}]\n")
                 return  # Exit the loop cleanly
 
-            elif choice == "1":
-                # Add new quote
-                console.clear()
-                add_quote(
-                    text=None,
-                    editor=False,
-                    author=None,
-                    source=None,
-                    note=None,
-                    categories=None,
-                    skip_ai=False,
-                    theme=None,
-                )
-                dim_style = get_color("dim")
-                prompt_continue(f"\n[{dim_style}]Press Enter to continue[/{dim_style}]")
-
-            elif choice == "2":
-                # View daily quote
-                console.clear()
-                show_daily(quiet=False, force=False, theme=None)
-                dim_style = get_color("dim")
-                prompt_continue(f"\n[{dim_style}]Press Enter to continue[/{dim_style}]")
-
-            elif choice == "3":
-                # List all quotes
-                console.clear()
-                list_quotes(category=None, author=None, limit=10, all=True, theme=None)
-                dim_style = get_color("dim")
-                prompt_continue(f"\n[{dim_style}]Press Enter to continue[/{dim_style}]")
-
-            elif choice == "4":
-                # Search quotes
-                console.clear()
-                prompt_style = f"bold {get_color('primary')}"
-                query = prompt_input(f"[{prompt_style}]Search query:[/{prompt_style}] ")
-                if query:
-                    search_quotes(query=query, case_sensitive=False, theme=None)
-                dim_style = get_color("dim")
-                prompt_continue(f"\n[{dim_style}]Press Enter to continue[/{dim_style}]")
-
-            elif choice == "5":
-                # View quote details
-                console.clear()
-                prompt_style = f"bold {get_color('primary')}"
-                quote_id = prompt_input(
-                    f"[{prompt_style}]Enter quote ID:[/{prompt_style}] "
-                )
-                if quote_id:
-                    view_quote(quote_id=quote_id, explain=False, theme=None)
-                dim_style = get_color("dim")
-                prompt_continue(f"\n[{dim_style}]Press Enter to continue[/{dim_style}]")
-
-            elif choice == "6":
-                # Edit quote
-                console.clear()
-                prompt_style = f"bold {get_color('primary')}"
-                quote_id = prompt_input(
-                    f"[{prompt_style}]Enter quote ID to edit:[/{prompt_style}] "
-                )
-                if quote_id:
-                    edit_quote(quote_id=quote_id, theme=None)
-                dim_style = get_color("dim")
-                prompt_continue(f"\n[{dim_style}]Press Enter to continue[/{dim_style}]")
-
-            elif choice == "7":
-                # Delete quote
-                console.clear()
-                prompt_style = f"bold {get_color('primary')}"
-                quote_id = prompt_input(
-                    f"[{prompt_style}]Enter quote ID to delete:[/{prompt_style}] "
-                )
-                if quote_id:
-                    delete_quote_command(quote_id=quote_id, force=False, theme=None)
-                dim_style = get_color("dim")
-                prompt_continue(f"\n[{dim_style}]Press Enter to continue[/{dim_style}]")
-
-            elif choice == "8":
-                # Setup shell integration
-                console.clear()
-                setup_shell()
-                dim_style = get_color("dim")
-                prompt_continue(f"\n[{dim_style}]Press Enter to continue[/{dim_style}]")
-
-            elif choice == "9":
-                # Change theme
+            action = MENU_ACTIONS.get(choice)
+            if action:
                 console.clear()
-                from commands.theme import change_theme_interactive
-
-                change_theme_interactive()
-                dim_style = get_color("dim")
-                prompt_continue(f"\n[{dim_style}]Press Enter to continue[/{dim_style}]")
+                action()
+                _press_enter()
 
         except KeyboardInterrupt:
             goodbye_style = get_color("primary")
@@ -180,8 +173,7 @@ def run_interactive_menu():
         except Exception as e:
             error_style = get_color("error")
             console.print(f"\n[{error_style}]Error: {e}[/{error_style}]\n")
-            dim_style = get_color("dim")
-            prompt_continue(f"[{dim_style}]Press Enter to continue[/{dim_style}]")
+            _press_enter(prefix="")
 
 
 # Register commands
@@ -1,10 +1,14 @@
 """Configuration data model."""
 
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, List
 
+# Same as models.quote: slotted dataclasses where Python supports them (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(eq=False, **_SLOTS)
 class AIConfig:
     """AI-related configuration settings."""
 
@@ -33,7 +37,7 @@ class AIConfig:
         )
 
 
-@dataclass
+@dataclass(eq=False, **_SLOTS)
 class Preferences:
     """User preferences."""
 
@@ -68,7 +72,7 @@ class Preferences:
         )
 
 
-@dataclass
+@dataclass(eq=False, **_SLOTS)
 class Config:
     """Application configuration."""
 
@@ -93,7 +97,7 @@ class Config:
         ai_config = AIConfig.from_dict(data.get("ai", {}))
         return cls(
             version=data.get("version", "1.0"),
-            custom_categories=data.get("custom_categories", []),
+            custom_categories=list(data.get("custom_categories", [])),
             preferences=preferences,
             ai=ai_config,
         )
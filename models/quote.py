@@ -1,12 +1,22 @@
 """Quote data model."""
 
+import sys
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
+# Slotted instances are smaller and have faster attribute access;
+# dataclass(slots=True) needs Python 3.10+, so older versions go without
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def utcnow_iso() -> str:
+    """Current UTC time as a naive ISO string, the format stored in quotes.json."""
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+@dataclass(eq=False, **_SLOTS)
 class AIMetadata:
     """AI-generated metadata for a quote."""
 
@@ -19,7 +29,7 @@ class AIMetadata:
         """Convert to dictionary for JSON serialization."""
         return {
             "author_confidence": self.author_confidence,
-            "suggested_categories": self.suggested_categories,
+            "suggested_categories": list(self.suggested_categories),
             "category_confidence": self.category_confidence,
             "duplicate_check_date": self.duplicate_check_date,
         }
@@ -29,13 +39,13 @@ class AIMetadata:
         """Create from dictionary."""
         return cls(
             author_confidence=data.get("author_confidence", 0.0),
-            suggested_categories=data.get("suggested_categories", []),
+            suggested_categories=list(data.get("suggested_categories", [])),
             category_confidence=data.get("category_confidence", 0.0),
             duplicate_check_date=data.get("duplicate_check_date"),
         )
 
 
-@dataclass
+@dataclass(eq=False, **_SLOTS)
 class Quote:
     """A quote with metadata and tracking information."""
 
@@ -45,7 +55,7 @@ class Quote:
     personal_note: str = ""
     categories: List[str] = field(default_factory=list)
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    date_added: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    date_added: str = field(default_factory=utcnow_iso)
     date_modified: Optional[str] = None
     last_shown: Optional[str] = None
     times_shown: int = 0
@@ -59,7 +69,7 @@ class Quote:
             "author": self.author,
             "source": self.source,
             "personal_note": self.personal_note,
-            "categories": self.categories,
+            "categories": list(self.categories),
             "date_added": self.date_added,
             "date_modified": self.date_modified,
             "last_shown": self.last_shown,
@@ -71,14 +81,17 @@ class Quote:
     def from_dict(cls, data: Dict) -> "Quote":
         """Create Quote from dictionary."""
         ai_metadata = AIMetadata.from_dict(data.get("ai_metadata", {}))
+        # Fallbacks are only generated when missing, not on every load
+        quote_id = data["id"] if "id" in data else str(uuid.uuid4())
+        date_added = data["date_added"] if "date_added" in data else utcnow_iso()
         return cls(
-            id=data.get("id", str(uuid.uuid4())),
+            id=quote_id,
             text=data["text"],
             author=data.get("author", "Anonymous"),
             source=data.get("source", ""),
             personal_note=data.get("personal_note", ""),
-            categories=data.get("categories", []),
-            date_added=data.get("date_added", datetime.utcnow().isoformat()),
+            categories=list(data.get("categories", [])),
+            date_added=date_added,
             date_modified=data.get("date_modified"),
             last_shown=data.get("last_shown"),
             times_shown=data.get("times_shown", 0),
@@ -87,5 +100,5 @@ class Quote:
 
     def mark_shown(self) -> None:
         """Update tracking info when quote is displayed."""
-        self.last_shown = datetime.utcnow().isoformat()
+        self.last_shown = utcnow_iso()
         self.times_shown += 1
@@ -4,15 +4,15 @@ from setuptools import find_packages, setup
 
 from version import __author__, __description__, __version__
 
+# Comments and dev-only tools are left out of the install requirements
+_SKIP_PREFIXES = ("#", "black", "ruff")
+
 # Read requirements from requirements.txt
 with open("requirements.txt", "r", encoding="utf-8") as f:
     requirements = [
-        line.strip()
-        for line in f
-        if line.strip()
-        and not line.startswith("#")
-        and not line.startswith("black")
-        and not line.startswith("ruff")
+        line
+        for line in (raw.strip() for raw in f)
+        if line and not line.startswith(_SKIP_PREFIXES)
     ]
 
 # Read long description from README
@@ -14,6 +14,10 @@ MAX_CATEGORY_LENGTH = 50
 
 console = Console()
 
+# Status cell for selected and unselected rows
+CHECKED_MARK = "[✓]"
+UNCHECKED_MARK = "[ ]"
+
 # Predefined categories from spec
 PREDEFINED_CATEGORIES = [
     "inspiration",
@@ -47,56 +51,65 @@ def select_categories(
 
     selected = set(preselected)
     custom_categories: list[str] = []
+    # Predefined then custom, in menu order; extended as customs are added
+    all_categories = list(PREDEFINED_CATEGORIES)
 
     while True:
-        # Clear and display header
-        console.clear()
-        console.print("\n[bold cyan]Select Categories[/bold cyan]\n")
-        if ai_suggested and preselected:
+        # Redraw the whole screen as one frame, flushed in a single write
+        with console:
+            # Clear and display header
+            console.clear()
+            console.print("\n[bold cyan]Select Categories[/bold cyan]\n")
+            if ai_suggested and preselected:
+                console.print(
+                    f"[green]✓ AI suggested:[/green] [cyan]{', '.join(preselected)}[/cyan]\n"
+                )
             console.print(
-                f"[green]✓ AI suggested:[/green] [cyan]{', '.join(preselected)}[/cyan]\n"
+                "[dim]Use the number to toggle categories, or 'c' to add custom[/dim]\n"
             )
-        console.print(
-            "[dim]Use the number to toggle categories, or 'c' to add custom[/dim]\n"
-        )
-
-        # Create table showing all categories
-        table = Table(show_header=False, box=None, padding=(0, 2))
-        table.add_column("Number", style="dim yellow", width=4)
-        table.add_column("Status", width=3)
-        table.add_column("Category", style="cyan")
-
-        # Add predefined categories
-        for i, category in enumerate(PREDEFINED_CATEGORIES, 1):
-            checkbox = "✓" if category in selected else " "
-            table.add_row(str(i), f"[{checkbox}]", category)
 
-        # Add custom categories if any
-        for i, category in enumerate(custom_categories, len(PREDEFINED_CATEGORIES) + 1):
-            checkbox = "✓" if category in selected else " "
-            table.add_row(str(i), f"[{checkbox}]", f"{category} [dim](custom)[/dim]")
-
-        # Display in a panel
-        panel = Panel(table, border_style="blue", padding=(1, 2))
-        console.print(panel)
-
-        # Show current selection
-        if selected:
+            # Create table showing all categories
+            table = Table(show_header=False, box=None, padding=(0, 2))
+            table.add_column("Number", style="dim yellow", width=4)
+            table.add_column("Status", width=3)
+            table.add_column("Category", style="cyan")
+
+            # Add predefined categories
+            for i, category in enumerate(PREDEFINED_CATEGORIES, 1):
+                mark = CHECKED_MARK if category in selected else UNCHECKED_MARK
+                table.add_row(str(i), mark, category)
+
+            # Add custom categories if any
+            for i, category in enumerate(
+                custom_categories, len(PREDEFINED_CATEGORIES) + 1
+            ):
+                mark = CHECKED_MARK if category in selected else UNCHECKED_MARK
+                table.add_row(str(i), mark, f"{category} [dim](custom)[/dim]")
+
+            # Display in a panel
+            panel = Panel(table, border_style="blue", padding=(1, 2))
+            console.print(panel)
+
+            # Show current selection
+            if selected:
+                console.print(
+                    f"\n[bold]Selected:[/bold] {', '.join(sorted(selected))}",
+                    style="green",
+                )
+            else:
+                console.print("\n[dim]No categories selected[/dim]")
+
+            # Show the options
             console.print(
-                f"\n[bold]Selected:[/bold] {', '.join(sorted(selected))}", style="green"
+                "\n[yellow]Options:[/yellow] Enter number to toggle | [cyan]c[/cyan] = add custom | [cyan]d[/cyan] = done | [cyan]x[/cyan] = cancel"
             )
-        else:
-            console.print("\n[dim]No categories selected[/dim]")
 
         # Get user input
-        console.print(
-            "\n[yellow]Options:[/yellow] Enter number to toggle | [cyan]c[/cyan] = add custom | [cyan]d[/cyan] = done | [cyan]x[/cyan] = cancel"
-        )
         choice = prompt_input("Choice: ", default="d").lower().strip()
 
         if choice == "d":
             # Done selecting
-            return sorted(list(selected))
+            return sorted(selected)
 
         elif choice == "x":
             # Cancel
@@ -130,11 +143,9 @@ def select_categories(
                     prompt_continue("[dim]Press Enter to continue[/dim]")
                     continue
 
-                if (
-                    custom not in PREDEFINED_CATEGORIES
-                    and custom not in custom_categories
-                ):
+                if custom not in all_categories:
                     custom_categories.append(custom)
+                    all_categories.append(custom)
                     selected.add(custom)
                     console.print(f"[green]✓ Added '{custom}'[/green]")
                 else:
@@ -146,8 +157,6 @@ def select_categories(
         elif choice.isdigit():
             # Toggle category
             num = int(choice)
-            all_categories = PREDEFINED_CATEGORIES + custom_categories
-
             if 1 <= num <= len(all_categories):
                 category = all_categories[num - 1]
                 if category in selected:
@@ -1,7 +1,40 @@
 """Date and time utilities."""
 
-from datetime import datetime, timedelta
-from typing import Optional
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Iterator, Optional
+
+# Seconds per minute and per hour, for relative times within a day
+_MINUTE = 60
+_HOUR = 3600
+
+# Time pinned by frozen_now(), or None to read the clock
+_now_override: Optional[datetime] = None
+
+
+def _utcnow() -> datetime:
+    """Return the current naive UTC time, or the time pinned by frozen_now()."""
+    if _now_override is not None:
+        return _now_override
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@contextmanager
+def frozen_now() -> Iterator[None]:
+    """
+    Pin "now" for the date helpers while rendering a batch of quotes.
+
+    The clock is read once on entry, so every relative time in the batch is
+    measured from the same instant.
+    """
+    global _now_override
+    previous = _now_override
+    _now_override = _utcnow()
+    try:
+        yield
+    finally:
+        _now_override = previous
 
 
 def parse_iso_datetime(iso_string: Optional[str]) -> Optional[datetime]:
@@ -14,16 +47,23 @@ def parse_iso_datetime(iso_string: Optional[str]) -> Optional[datetime]:
     Returns:
         datetime object or None if parsing fails
     """
-    if not iso_string:
+    # Anything but a non-empty string (e.g. a hand-edited data file) is
+    # unparseable, and must not reach the cache, which needs hashable keys
+    if not iso_string or not isinstance(iso_string, str):
         return None
+    return _parse_iso_datetime_cached(iso_string)
+
 
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime_cached(iso_string: str) -> Optional[datetime]:
+    """Parse a non-empty ISO string, cached since datetimes are immutable."""
+    # fromisoformat handles fractional seconds itself, but not a "Z" suffix
+    # before Python 3.11
+    if iso_string.endswith("Z"):
+        iso_string = iso_string[:-1] + "+00:00"
     try:
-        # Handle both with and without microseconds
-        if "." in iso_string:
-            return datetime.fromisoformat(iso_string.replace("Z", "+00:00"))
-        else:
-            return datetime.fromisoformat(iso_string.replace("Z", "+00:00"))
-    except Exception:
+        return datetime.fromisoformat(iso_string)
+    except ValueError:
         return None
 
 
@@ -45,7 +85,7 @@ def is_today(iso_string: Optional[str]) -> bool:
         return False
 
     # Compare dates (ignoring time)
-    today = datetime.utcnow().date()
+    today = _utcnow().date()
     return dt.date() == today
 
 
@@ -66,7 +106,7 @@ def days_ago(iso_string: Optional[str]) -> Optional[int]:
     if not dt:
         return None
 
-    now = datetime.utcnow()
+    now = _utcnow()
     delta = now - dt
     return delta.days
 
@@ -88,31 +128,32 @@ def format_relative_time(iso_string: Optional[str]) -> str:
     if not dt:
         return "unknown"
 
-    now = datetime.utcnow()
-    delta = now - dt
+    delta = _utcnow() - dt
+    days = delta.days
 
-    if delta.days == 0:
-        if delta.seconds < 60:
+    if days == 0:
+        seconds = delta.seconds
+        if seconds < _MINUTE:
             return "just now"
-        elif delta.seconds < 3600:
-            minutes = delta.seconds // 60
-            return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
+        elif seconds < _HOUR:
+            return _ago(seconds // _MINUTE, "minute")
         else:
-            hours = delta.seconds // 3600
-            return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    elif delta.days == 1:
+            return _ago(seconds // _HOUR, "hour")
+    elif days == 1:
         return "yesterday"
-    elif delta.days < 7:
-        return f"{delta.days} days ago"
-    elif delta.days < 30:
-        weeks = delta.days // 7
-        return f"{weeks} week{'s' if weeks != 1 else ''} ago"
-    elif delta.days < 365:
-        months = delta.days // 30
-        return f"{months} month{'s' if months != 1 else ''} ago"
+    elif days < 7:
+        return f"{days} days ago"
+    elif days < 30:
+        return _ago(days // 7, "week")
+    elif days < 365:
+        return _ago(days // 30, "month")
     else:
-        years = delta.days // 365
-        return f"{years} year{'s' if years != 1 else ''} ago"
+        return _ago(days // 365, "year")
+
+
+def _ago(count: int, unit: str) -> str:
+    """Format a count of units as e.g. "1 week ago" or "3 weeks ago"."""
+    return f"{count} {unit}{'' if count == 1 else 's'} ago"
 
 
 def format_date(iso_string: Optional[str]) -> str:
@@ -125,9 +166,14 @@ def format_date(iso_string: Optional[str]) -> str:
     Returns:
         Formatted date string
     """
-    if not iso_string:
+    if not iso_string or not isinstance(iso_string, str):
         return "unknown"
+    return _format_date_cached(iso_string)
+
 
+@lru_cache(maxsize=4096)
+def _format_date_cached(iso_string: str) -> str:
+    """Format a non-empty ISO string as a date, cached by string."""
     dt = parse_iso_datetime(iso_string)
     if not dt:
         return "unknown"
@@ -153,6 +199,6 @@ def is_within_days(iso_string: Optional[str], days: int) -> bool:
     if not dt:
         return False
 
-    now = datetime.utcnow()
+    now = _utcnow()
     cutoff = now - timedelta(days=days)
     return dt >= cutoff
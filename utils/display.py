@@ -1,6 +1,6 @@
 """Terminal display utilities using Rich - Theme-aware."""
 
-from typing import List
+from typing import List, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -8,7 +8,8 @@ from rich.table import Table
 from rich.text import Text
 
 from models.quote import Quote
-from utils.date_utils import format_date, format_relative_time
+from utils.date_utils import format_date, format_relative_time, frozen_now
+from utils.storage import MAX_ID_MATCHES
 from utils.themes import get_color, load_theme
 
 console = Console()
@@ -51,17 +52,19 @@ def display_quote_boxed(quote: Quote, show_id: bool = False) -> None:
         padding=(1, 2),
     )
 
-    console.print(panel)
+    # Buffer the panel and metadata so they reach the terminal in one write
+    with console:
+        console.print(panel)
 
-    # Show metadata below box
-    metadata = []
-    if show_id:
-        metadata.append(f"Quote #{quote.id}")
-    if quote.categories:
-        metadata.append(f"Categories: {', '.join(quote.categories)}")
+        # Show metadata below box
+        metadata = []
+        if show_id:
+            metadata.append(f"Quote #{quote.id}")
+        if quote.categories:
+            metadata.append(f"Categories: {', '.join(quote.categories)}")
 
-    if metadata:
-        console.print(" | ".join(metadata), style=get_color("secondary"))
+        if metadata:
+            console.print(" | ".join(metadata), style=get_color("secondary"))
 
 
 def display_quote_minimal(quote: Quote) -> None:
@@ -88,33 +91,34 @@ def display_quote_detailed(quote: Quote) -> None:
     quote_text.append("\n\n")
     quote_text.append(f"— {quote.author}", style=get_color("secondary"))
 
-    # Details
+    # Details, with every label in the same style
+    label_style = f"bold {get_color('secondary')}"
     details = Text()
 
     if quote.source:
-        details.append("\n\nSource: ", style=f"bold {get_color('secondary')}")
+        details.append("\n\nSource: ", style=label_style)
         details.append(quote.source)
 
     if quote.personal_note:
-        details.append("\n\nYour note:\n", style=f"bold {get_color('secondary')}")
+        details.append("\n\nYour note:\n", style=label_style)
         details.append(quote.personal_note)
 
     if quote.categories:
-        details.append("\n\nCategories: ", style=f"bold {get_color('secondary')}")
+        details.append("\n\nCategories: ", style=label_style)
         details.append(", ".join(quote.categories), style=get_color("emphasis"))
 
-    details.append("\n\nAdded: ", style=f"bold {get_color('secondary')}")
+    details.append("\n\nAdded: ", style=label_style)
     details.append(format_date(quote.date_added))
 
     if quote.date_modified:
-        details.append("\nLast modified: ", style=f"bold {get_color('secondary')}")
+        details.append("\nLast modified: ", style=label_style)
         details.append(format_date(quote.date_modified))
 
     if quote.last_shown:
-        details.append("\nLast shown: ", style=f"bold {get_color('secondary')}")
+        details.append("\nLast shown: ", style=label_style)
         details.append(format_relative_time(quote.last_shown))
 
-    details.append("\nTimes shown: ", style=f"bold {get_color('secondary')}")
+    details.append("\nTimes shown: ", style=label_style)
     details.append(str(quote.times_shown))
 
     # Combine and display
@@ -129,44 +133,66 @@ def display_quote_detailed(quote: Quote) -> None:
     console.print(panel)
 
 
-def display_quote_list(quotes: List[Quote], max_display: int = 10) -> None:
+def display_quote_list(
+    quotes: List[Quote], max_display: int = 10, total: Optional[int] = None
+) -> None:
     """
     Display a list of quotes in summary format.
 
     Args:
         quotes: List of Quote objects
         max_display: Maximum number of quotes to display
+        total: Size of the full collection, if quotes is only its first part
+            (defaults to len(quotes))
     """
     if not quotes:
         console.print("No quotes found.", style=get_color("warning"))
         return
 
-    total = len(quotes)
+    if total is None:
+        total = len(quotes)
     display_quotes = quotes[:max_display]
 
-    for i, quote in enumerate(display_quotes, 1):
-        # Truncate long quotes
-        text = quote.text
-        if len(text) > 80:
-            text = text[:77] + "..."
-
-        # Format line - show quote ID instead of sequential number
-        console.print(f"({quote.id[:8]}) ", style=get_color("warning"), end="")
-        console.print(f'"{text}"', style=get_color("primary"))
-        console.print(f"   — {quote.author}", style=get_color("secondary"), end="")
-
-        if quote.categories:
-            console.print(
-                f" | {', '.join(quote.categories)}", style=get_color("emphasis"), end=""
-            )
-
-        if quote.date_added:
-            console.print(
-                f" | Added: {format_relative_time(quote.date_added)}",
-                style=get_color("dim"),
-            )
-        else:
-            console.print()
+    # The theme can't change mid-render, so look each style up once
+    id_style = get_color("warning")
+    text_style = get_color("primary")
+    author_style = get_color("secondary")
+    categories_style = get_color("emphasis")
+    date_style = get_color("dim")
+
+    # Build every row as Text and print them together, so the list is
+    # rendered and written once; one clock read for the whole list keeps
+    # the relative times consistent
+    rows = []
+    with frozen_now():
+        for quote in display_quotes:
+            # Truncate long quotes
+            text = quote.text
+            if len(text) > 80:
+                text = text[:77] + "..."
+
+            # Format line - show quote ID instead of sequential number.
+            # render_str applies the same markup and highlighting print would
+            parts = [
+                (f"({quote.id[:8]}) ", id_style),
+                (f'"{text}"\n', text_style),
+                (f"   — {quote.author}", author_style),
+            ]
+            if quote.categories:
+                parts.append((f" | {', '.join(quote.categories)}", categories_style))
+            if quote.date_added:
+                parts.append(
+                    (f" | Added: {format_relative_time(quote.date_added)}", date_style)
+                )
+
+            row = Text()
+            for part, style in parts:
+                rendered = console.render_str(part)
+                rendered.style = style
+                row.append_text(rendered)
+            rows.append(row)
+
+    console.print(Text("\n").join(rows))
 
     if total > max_display:
         console.print(
@@ -186,10 +212,12 @@ def display_search_results(quotes: List[Quote], query: str) -> None:
         console.print(f"No quotes found matching '{query}'", style=get_color("warning"))
         return
 
-    console.print(
-        f"\nFound {len(quotes)} quote(s):\n", style=f"{get_color('success')} bold"
-    )
-    display_quote_list(quotes)
+    # Buffer the header and list so they reach the terminal in one write
+    with console:
+        console.print(
+            f"\nFound {len(quotes)} quote(s):\n", style=f"{get_color('success')} bold"
+        )
+        display_quote_list(quotes)
 
 
 def display_success(message: str) -> None:
@@ -212,6 +240,26 @@ def display_error(message: str) -> None:
     console.print(f"❌ {message}", style=f"bold {get_color('error')}")
 
 
+def display_id_matches(quote_id: str, matches: List[Quote]) -> None:
+    """
+    Explain why a full or partial quote ID didn't identify a single quote.
+
+    Args:
+        quote_id: The ID the user entered
+        matches: Quotes whose ID starts with it (none, or more than one)
+    """
+    if not matches:
+        display_error(f"No quote found with ID '{quote_id}'")
+        console.print("\n[dim]Use 'quotes list' to see all quotes and their IDs[/dim]")
+        return
+
+    display_error(f"Multiple quotes match '{quote_id}'. Please be more specific:")
+    preview = [f'  - {q.id[:8]}: "{q.text[:50]}..."' for q in matches[:MAX_ID_MATCHES]]
+    if len(matches) > MAX_ID_MATCHES:
+        preview.append("  - ...and more")
+    console.print("\n".join(preview))
+
+
 def display_warning(message: str) -> None:
     """
     Display a warning message.
@@ -243,24 +291,26 @@ def display_similar_quote(
         new_text: The new quote text
         similarity: Similarity score (0-100)
     """
-    console.print(
-        f"\n⚠️  Similar quote found ({similarity:.0f}% match):\n",
-        style=f"{get_color('warning')} bold",
-    )
+    # Buffer the comparison so it reaches the terminal in one write
+    with console:
+        console.print(
+            f"\n⚠️  Similar quote found ({similarity:.0f}% match):\n",
+            style=f"{get_color('warning')} bold",
+        )
 
-    # Existing quote
-    console.print("Existing quote:", style=f"bold {get_color('secondary')}")
-    console.print(f'  "{existing_quote.text}"', style=get_color("primary"))
-    console.print(f"  — {existing_quote.author}", style=get_color("secondary"))
-    console.print(
-        f"  Added: {format_date(existing_quote.date_added)}", style=get_color("dim")
-    )
+        # Existing quote
+        console.print("Existing quote:", style=f"bold {get_color('secondary')}")
+        console.print(f'  "{existing_quote.text}"', style=get_color("primary"))
+        console.print(f"  — {existing_quote.author}", style=get_color("secondary"))
+        console.print(
+            f"  Added: {format_date(existing_quote.date_added)}", style=get_color("dim")
+        )
 
-    console.print()
+        console.print()
 
-    # New quote
-    console.print("Your new quote:", style=f"bold {get_color('secondary')}")
-    console.print(f'  "{new_text}"', style=get_color("primary"))
+        # New quote
+        console.print("Your new quote:", style=f"bold {get_color('secondary')}")
+        console.print(f'  "{new_text}"', style=get_color("primary"))
 
 
 def create_category_table(categories: List[str], selected: List[str]) -> Table:
@@ -1,5 +1,6 @@
 """Input helpers with proper backspace support using prompt_toolkit."""
 
+import importlib.util
 from typing import List
 
 import typer
@@ -8,14 +9,9 @@ from rich.prompt import Confirm, Prompt
 
 console = Console()
 
-# Import prompt_toolkit for better input handling
-PT_AVAILABLE = False
-try:
-    from prompt_toolkit import PromptSession  # type: ignore
-
-    PT_AVAILABLE = True
-except Exception:
-    PT_AVAILABLE = False
+# Use prompt_toolkit for better input handling; it's slow to import, so
+# only check it's installed here and import it when a prompt is shown
+PT_AVAILABLE = importlib.util.find_spec("prompt_toolkit") is not None
 
 
 def prompt_input(prompt_text: str, default: str = "") -> str:
@@ -33,6 +29,8 @@ def prompt_input(prompt_text: str, default: str = "") -> str:
     """
     if PT_AVAILABLE:
         try:
+            from prompt_toolkit import PromptSession  # type: ignore
+
             # Print the formatted prompt using Rich, then get input with prompt_toolkit
             console.print(prompt_text)
             session = PromptSession()
@@ -63,10 +61,13 @@ def prompt_choice(prompt_text: str, choices: List[str], default: str) -> str:
     """
     if PT_AVAILABLE:
         try:
+            from prompt_toolkit import PromptSession  # type: ignore
+
+            # One session serves every retry after an invalid choice
+            session = PromptSession()
             while True:
                 # Print the formatted prompt using Rich, then get input with prompt_toolkit
                 console.print(prompt_text)
-                session = PromptSession()
                 result = session.prompt("").strip()  # Input on next line after prompt
                 if not result:
                     return default
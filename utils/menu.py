@@ -1,5 +1,7 @@
 """Interactive menu for Quotes Manager."""
 
+from typing import Any, Dict
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -11,47 +13,79 @@ from utils.themes import get_color
 console = Console()
 
 
-def display_menu() -> None:
-    """Display the main menu with available options."""
-    console.clear()
+# Menu number and label for each main menu option
+MENU_ITEMS = (
+    ("1", "Add new quote"),
+    ("2", "View daily quote"),
+    ("3", "List all quotes"),
+    ("4", "Search quotes"),
+    ("5", "View quote details"),
+    ("6", "Edit quote"),
+    ("7", "Delete quote"),
+    ("8", "Setup shell integration"),
+    ("9", "Change theme"),
+    ("0", "Exit"),
+)
+MENU_CHOICES = sorted(number for number, _ in MENU_ITEMS)
+
+# Last built menu panel, keyed by the colors it was built with
+_menu_panel_cache: Dict[str, Any] = {"colors": None, "panel": None}
+
+
+def _build_menu_panel(colors: tuple) -> Panel:
+    """
+    Build the main menu panel.
+
+    Args:
+        colors: (primary, dim, warning, border) theme colors
+
+    Returns:
+        Panel containing the menu options
+    """
+    primary, dim, warning, border = colors
 
     # Create title
     title = Text()
-    title.append("Quotes Manager", style=f"bold {get_color('primary')}")
-    title.append(" - Interactive Menu", style=get_color("dim"))
+    title.append("Quotes Manager", style=f"bold {primary}")
+    title.append(" - Interactive Menu", style=dim)
 
     # Create menu table
     table = Table(show_header=False, box=None, padding=(0, 2))
-    table.add_column("Number", style=get_color("warning"), width=4)
-    table.add_column("Command", style=get_color("primary"))
-
-    menu_items = [
-        ("1", "Add new quote"),
-        ("2", "View daily quote"),
-        ("3", "List all quotes"),
-        ("4", "Search quotes"),
-        ("5", "View quote details"),
-        ("6", "Edit quote"),
-        ("7", "Delete quote"),
-        ("8", "Setup shell integration"),
-        ("9", "Change theme"),
-        ("0", "Exit"),
-    ]
-
-    for number, command in menu_items:
+    table.add_column("Number", style=warning, width=4)
+    table.add_column("Command", style=primary)
+
+    for number, command in MENU_ITEMS:
         table.add_row(number, command)
 
     # Display in a panel
-    panel = Panel(
+    return Panel(
         table,
         title=title,
-        border_style=get_color("border"),
+        border_style=border,
         padding=(1, 2),
     )
 
-    console.print()
-    console.print(panel)
-    console.print()
+
+def display_menu() -> None:
+    """Display the main menu with available options."""
+    # The panel only changes with the theme, so it's rebuilt only then
+    colors = (
+        get_color("primary"),
+        get_color("dim"),
+        get_color("warning"),
+        get_color("border"),
+    )
+    if _menu_panel_cache["colors"] != colors:
+        _menu_panel_cache["panel"] = _build_menu_panel(colors)
+        _menu_panel_cache["colors"] = colors
+    panel = _menu_panel_cache["panel"]
+
+    # Clear and redraw as one frame, flushed in a single write
+    with console:
+        console.clear()
+        console.print()
+        console.print(panel)
+        console.print()
 
 
 def get_menu_choice() -> str:
@@ -64,7 +98,7 @@ def get_menu_choice() -> str:
     prompt_style = f"bold {get_color('warning')}"
     choice = prompt_choice(
         f"[{prompt_style}]Select an option:[/{prompt_style}] ",
-        choices=["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"],
+        choices=MENU_CHOICES,
         default="0",
     )
     return choice
@@ -78,9 +112,10 @@ def show_menu_message(message: str, style: str = "green") -> None:
         message: Message to display
         style: Rich style for the message
     """
-    console.print()
-    console.print(f"[{style}]{message}[/{style}]")
-    console.print()
+    with console:
+        console.print()
+        console.print(f"[{style}]{message}[/{style}]")
+        console.print()
     prompt_continue("[dim]Press Enter to continue[/dim]")
 
 
@@ -1,18 +1,58 @@
 """JSON storage utilities for quotes and configuration."""
 
+import bisect
+import heapq
 import json
+import os
+import re
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from models.config import Config
-from models.quote import Quote
+from models.quote import Quote, utcnow_iso
+
+# Optional faster JSON library; falls back to the standard json module
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
 
 # Storage paths
 BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / "local_data" / "personal_data"
 QUOTES_FILE = DATA_DIR / "quotes.json"
 CONFIG_FILE = DATA_DIR / "config.json"
+CLAUDE_CACHE_DIR = DATA_DIR / "claude_cache"
+
+# Ways find_quotes can match a multi-word query
+SEARCH_MODES = ("phrase", "any", "all")
+
+# Most matches an ambiguous partial ID is resolved to (one more is fetched to
+# show the list was cut short)
+MAX_ID_MATCHES = 5
+
+# Parsed quotes.json document, keyed by the file's (mtime, size); "summaries"
+# holds the id/text/author view used for duplicate checks, "index" maps
+# quote id to position, "sorted_ids" holds (id, position) pairs in id order
+# for prefix lookups, "searchable" holds each quote's searchable text and
+# "recent_ids" holds the display history's ids, each built on first request
+_quotes_cache: Dict = {
+    "stamp": None,
+    "document": None,
+    "summaries": None,
+    "index": None,
+    "sorted_ids": None,
+    "searchable": None,
+    "recent_ids": None,
+}
+
+# Parsed config.json, keyed by the file's (mtime, size) so edits are picked up
+_config_cache: Dict = {"stamp": None, "data": None}
 
 
 def ensure_data_dir() -> None:
@@ -20,52 +60,96 @@ def ensure_data_dir() -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def load_quotes() -> List[Quote]:
+def _read_json(path: Path) -> Any:
     """
-    Load all quotes from storage.
+    Read and parse a JSON file.
 
-    Returns:
-        List of Quote objects
+    Raises:
+        json.JSONDecodeError: If the file isn't valid JSON
     """
-    ensure_data_dir()
+    if ORJSON_AVAILABLE:
+        # Whole-file read, so skip the BufferedReader layer
+        with open(path, "rb", buffering=0) as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
 
-    if not QUOTES_FILE.exists():
-        return []
 
+def _write_json(path: Path, data: Any) -> None:
+    """
+    Write data as indented UTF-8 JSON.
+
+    Writes to a temporary file in the same directory and renames it over the
+    target, so an interrupted write never leaves a truncated file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
     try:
-        with open(QUOTES_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if ORJSON_AVAILABLE:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            # Serialize first so the file gets one write, not one per token
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(data, indent=2, ensure_ascii=False))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
-        quotes_data = data.get("quotes", [])
-        return [Quote.from_dict(q) for q in quotes_data]
-    except json.JSONDecodeError:
-        # Return empty list if file is corrupted
-        return []
-    except Exception:
-        return []
 
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Return a file's (mtime_ns, size), or None if it doesn't exist."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
 
-def save_quotes(quotes: List[Quote]) -> None:
+
+def _load_document() -> Dict:
     """
-    Save quotes to storage.
+    Read the whole quotes.json document.
 
-    Args:
-        quotes: List of Quote objects to save
+    The parse is cached until the file's modification time or size changes.
+    The returned dict is shared with the cache, so copy it before modifying.
+
+    Returns:
+        Parsed document, or an empty dict if the file is missing or unreadable
     """
-    ensure_data_dir()
+    stamp = _file_stamp(QUOTES_FILE)
+    if stamp is None:
+        return {}
 
-    # Load existing data structure or create new one
-    if QUOTES_FILE.exists():
+    if _quotes_cache["stamp"] != stamp:
         try:
-            with open(QUOTES_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            document = _read_json(QUOTES_FILE)
         except Exception:
-            data = {}
-    else:
-        data = {}
+            return {}
+        if not isinstance(document, dict):
+            return {}
 
-    # Update quotes
-    data["quotes"] = [q.to_dict() for q in quotes]
+        _quotes_cache["stamp"] = stamp
+        _quotes_cache["document"] = document
+        _quotes_cache["summaries"] = None
+        _quotes_cache["index"] = None
+        _quotes_cache["sorted_ids"] = None
+        _quotes_cache["searchable"] = None
+        _quotes_cache["recent_ids"] = None
+
+    return _quotes_cache["document"]
+
+
+def _write_document(data: Dict) -> None:
+    """
+    Fill in missing top-level fields and write the quotes.json document.
+
+    Args:
+        data: Document to write; must contain a "quotes" list
+    """
+    quote_count = len(data["quotes"])
 
     # Ensure other fields exist
     if "version" not in data:
@@ -76,16 +160,164 @@ def save_quotes(quotes: List[Quote]) -> None:
         data["last_daily_display"] = None
     if "stats" not in data:
         data["stats"] = {
-            "total_quotes": len(quotes),
+            "total_quotes": quote_count,
             "quotes_added_this_month": 0,
             "most_shown_quote_id": None,
         }
     else:
-        data["stats"]["total_quotes"] = len(quotes)
+        data["stats"] = {**data["stats"], "total_quotes": quote_count}
 
     # Write to file
-    with open(QUOTES_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _write_json(QUOTES_FILE, data)
+
+    # We already hold what was written, so the next load needn't re-read it
+    _quotes_cache["stamp"] = _file_stamp(QUOTES_FILE)
+    _quotes_cache["document"] = data
+    _quotes_cache["summaries"] = None
+    _quotes_cache["index"] = None
+    _quotes_cache["sorted_ids"] = None
+    _quotes_cache["searchable"] = None
+    _quotes_cache["recent_ids"] = None
+
+
+def _quote_position(document: Dict, quote_id: str) -> Optional[int]:
+    """
+    Find a quote's position in the document's quotes list.
+
+    Uses an id -> position index built once per document version.
+
+    Args:
+        document: Document returned by _load_document()
+        quote_id: The quote ID to look up
+
+    Returns:
+        Position of the first quote with that ID, or None if not found
+    """
+    index = _quotes_cache["index"]
+    if index is None or _quotes_cache["document"] is not document:
+        index = {}
+        for position, quote in enumerate(document.get("quotes", [])):
+            index.setdefault(quote.get("id"), position)
+        if _quotes_cache["document"] is document:
+            _quotes_cache["index"] = index
+    return index.get(quote_id)
+
+
+def _sorted_ids(document: Dict) -> List[Tuple[str, int]]:
+    """
+    List the document's (quote id, position) pairs sorted by id.
+
+    Built once per document version, like the _quote_position index.
+
+    Args:
+        document: Document returned by _load_document()
+
+    Returns:
+        Sorted (id, position) pairs for quotes that have a string id
+    """
+    sorted_ids = _quotes_cache["sorted_ids"]
+    if sorted_ids is None or _quotes_cache["document"] is not document:
+        sorted_ids = sorted(
+            (quote.get("id"), position)
+            for position, quote in enumerate(document.get("quotes", []))
+            if isinstance(quote.get("id"), str)
+        )
+        if _quotes_cache["document"] is document:
+            _quotes_cache["sorted_ids"] = sorted_ids
+    return sorted_ids
+
+
+def load_quotes() -> List[Quote]:
+    """
+    Load all quotes from storage.
+
+    The parsed file is cached until its modification time or size changes,
+    so repeated loads skip the disk read and JSON parse.
+
+    Returns:
+        List of Quote objects
+    """
+    ensure_data_dir()
+
+    try:
+        return [Quote.from_dict(q) for q in _load_document().get("quotes", [])]
+    except Exception:
+        # Return empty list if file is corrupted
+        return []
+
+
+def _summarize(quote: Dict) -> Dict:
+    """Reduce a stored quote dict to the fields duplicate checks display."""
+    return {
+        "id": quote.get("id", ""),
+        "text": quote["text"],
+        "author": quote.get("author", "Anonymous"),
+    }
+
+
+def load_quote_summaries() -> List[Dict]:
+    """
+    Load the id, text and author of every quote.
+
+    Built straight from the stored dicts rather than through Quote objects,
+    and cached alongside the parsed file, so treat the dicts as read-only.
+
+    Returns:
+        List of {"id", "text", "author"} dictionaries
+    """
+    ensure_data_dir()
+
+    document = _load_document()
+    summaries = _quotes_cache["summaries"]
+    if summaries is None or _quotes_cache["document"] is not document:
+        summaries = [
+            _summarize(q)
+            for q in document.get("quotes", [])
+            if isinstance(q, dict) and "text" in q
+        ]
+        if _quotes_cache["document"] is document:
+            _quotes_cache["summaries"] = summaries
+
+    return list(summaries)
+
+
+def save_quotes(quotes: List[Quote]) -> None:
+    """
+    Save quotes to storage.
+
+    Args:
+        quotes: List of Quote objects to save
+    """
+    ensure_data_dir()
+
+    # Start from the existing document so other fields are preserved
+    data = dict(_load_document())
+    data["quotes"] = [q.to_dict() for q in quotes]
+    _write_document(data)
+
+
+def append_quote(quote: Quote) -> None:
+    """
+    Add a single new quote to storage.
+
+    Extends the cached document instead of loading and re-serialising every
+    stored quote, as a load_quotes/save_quotes round-trip would.
+
+    Args:
+        quote: The new Quote object
+    """
+    ensure_data_dir()
+
+    data = dict(_load_document())
+    quote_dict = quote.to_dict()
+    data["quotes"] = list(data.get("quotes", [])) + [quote_dict]
+
+    previous_summaries = _quotes_cache["summaries"]
+    _write_document(data)
+
+    # Keep the summary view warm for the next duplicate check
+    if previous_summaries is not None:
+        _quotes_cache["summaries"] = previous_summaries + [_summarize(quote_dict)]
 
 
 def get_display_history() -> List[Dict]:
@@ -97,15 +329,30 @@ def get_display_history() -> List[Dict]:
     """
     ensure_data_dir()
 
-    if not QUOTES_FILE.exists():
-        return []
+    return list(_load_document().get("display_history", []))
 
-    try:
-        with open(QUOTES_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data.get("display_history", [])
-    except Exception:
-        return []
+
+def get_recently_shown_ids() -> frozenset:
+    """
+    Get the IDs of quotes in the display history.
+
+    The set is cached alongside the parsed file, so repeat calls are free
+    until the file changes.
+
+    Returns:
+        Frozenset of recently shown quote IDs
+    """
+    ensure_data_dir()
+
+    document = _load_document()
+    recent_ids = _quotes_cache["recent_ids"]
+    if recent_ids is None or _quotes_cache["document"] is not document:
+        recent_ids = frozenset(
+            entry.get("quote_id") for entry in document.get("display_history", [])
+        )
+        if _quotes_cache["document"] is document:
+            _quotes_cache["recent_ids"] = recent_ids
+    return recent_ids
 
 
 def add_to_display_history(quote_id: str) -> None:
@@ -120,31 +367,37 @@ def add_to_display_history(quote_id: str) -> None:
     # Load existing data
     if QUOTES_FILE.exists():
         try:
-            with open(QUOTES_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_json(QUOTES_FILE)
         except Exception:
             data = {}
     else:
         data = {"quotes": [], "display_history": []}
 
-    # Add to history
-    if "display_history" not in data:
-        data["display_history"] = []
+    _record_display(data, quote_id)
 
-    data["display_history"].append(
-        {"quote_id": quote_id, "shown_at": datetime.now().isoformat()}
-    )
+    # Write back
+    _write_json(QUOTES_FILE, data)
+
+
+def _record_display(data: Dict, quote_id: str) -> None:
+    """
+    Append a display history entry and update last_daily_display.
+
+    Args:
+        data: quotes.json document to modify in place
+        quote_id: ID of the quote that was displayed
+    """
+    # Local time, read once so both fields carry the same instant
+    shown_at = datetime.now().isoformat()
+
+    history = list(data.get("display_history", []))
+    history.append({"quote_id": quote_id, "shown_at": shown_at})
 
     # Keep only last 21 days of history (approximate with 21 entries)
-    if len(data["display_history"]) > 21:
-        data["display_history"] = data["display_history"][-21:]
+    data["display_history"] = history[-21:]
 
     # Update last daily display
-    data["last_daily_display"] = datetime.now().isoformat()
-
-    # Write back
-    with open(QUOTES_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    data["last_daily_display"] = shown_at
 
 
 def get_last_daily_display() -> Optional[str]:
@@ -156,37 +409,41 @@ def get_last_daily_display() -> Optional[str]:
     """
     ensure_data_dir()
 
-    if not QUOTES_FILE.exists():
-        return None
-
-    try:
-        with open(QUOTES_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data.get("last_daily_display")
-    except Exception:
-        return None
+    return _load_document().get("last_daily_display")
 
 
 def load_config() -> Config:
     """
     Load configuration from storage.
 
+    The parsed file is cached until its modification time or size changes,
+    so repeated calls don't re-read the disk.
+
     Returns:
         Config object
     """
     ensure_data_dir()
 
-    if not CONFIG_FILE.exists():
+    try:
+        stat = CONFIG_FILE.stat()
+    except FileNotFoundError:
         # Return default config
         return Config()
 
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    if _config_cache["stamp"] == stamp:
+        return Config.from_dict(_config_cache["data"])
+
     try:
-        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return Config.from_dict(data)
+        data = _read_json(CONFIG_FILE)
+        config = Config.from_dict(data)
     except Exception:
         return Config()
 
+    _config_cache["stamp"] = stamp
+    _config_cache["data"] = data
+    return config
+
 
 def save_config(config: Config) -> None:
     """
@@ -197,8 +454,8 @@ def save_config(config: Config) -> None:
     """
     ensure_data_dir()
 
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(config.to_dict(), f, indent=2, ensure_ascii=False)
+    _write_json(CONFIG_FILE, config.to_dict())
+    _config_cache["stamp"] = None
 
 
 def get_quote_by_id(quote_id: str) -> Optional[Quote]:
@@ -211,11 +468,192 @@ def get_quote_by_id(quote_id: str) -> Optional[Quote]:
     Returns:
         Quote object or None if not found
     """
-    quotes = load_quotes()
-    for quote in quotes:
-        if quote.id == quote_id:
-            return quote
-    return None
+    document = _load_document()
+    position = _quote_position(document, quote_id)
+    if position is None:
+        return None
+
+    try:
+        return Quote.from_dict(document["quotes"][position])
+    except Exception:
+        return None
+
+
+def _searchable_texts(document: Dict) -> List[Tuple[str, str]]:
+    """
+    Build each quote's searchable text, as-is and lowercased.
+
+    The text joins the quote, author, source, personal note and categories.
+    Built once per document version.
+
+    Args:
+        document: Document returned by _load_document()
+
+    Returns:
+        (text, lowercased text) pairs in document order
+    """
+    searchable = _quotes_cache["searchable"]
+    if searchable is None or _quotes_cache["document"] is not document:
+        searchable = []
+        for quote in document.get("quotes", []):
+            text = " ".join(
+                [
+                    quote.get("text") or "",
+                    quote.get("author") or "Anonymous",
+                    quote.get("source") or "",
+                    quote.get("personal_note") or "",
+                    " ".join(quote.get("categories") or []),
+                ]
+            )
+            searchable.append((text, text.lower()))
+        if _quotes_cache["document"] is document:
+            _quotes_cache["searchable"] = searchable
+    return searchable
+
+
+def load_newest_quotes(limit: Optional[int] = None) -> List[Quote]:
+    """
+    Load quotes newest first by date_added.
+
+    With a limit, the newest quotes are picked from the stored dicts, so
+    only those are built as Quote objects.
+
+    Args:
+        limit: Maximum number of quotes to return (None for all)
+
+    Returns:
+        List of Quote objects, newest first
+    """
+    ensure_data_dir()
+
+    stored = [q for q in _load_document().get("quotes", []) if isinstance(q, dict)]
+
+    def date_added(quote: Dict) -> str:
+        return quote.get("date_added") or ""
+
+    if limit is None:
+        newest = sorted(stored, key=date_added, reverse=True)
+    else:
+        newest = heapq.nlargest(limit, stored, key=date_added)
+
+    try:
+        return [Quote.from_dict(q) for q in newest]
+    except Exception:
+        return []
+
+
+def count_quotes() -> int:
+    """
+    Count the stored quotes without loading them as Quote objects.
+
+    Returns:
+        Number of quotes in storage
+    """
+    ensure_data_dir()
+
+    return len(_load_document().get("quotes", []))
+
+
+def find_quotes(
+    query: str, case_sensitive: bool = False, mode: str = "phrase"
+) -> List[Quote]:
+    """
+    Find quotes whose text, author, source, note or categories match query.
+
+    Matching runs over cached search strings, so only the matching quotes
+    are built as Quote objects.
+
+    Args:
+        query: Phrase or whitespace-separated words to look for
+        case_sensitive: Whether to match case exactly
+        mode: "phrase" matches the query as one substring, "any" matches
+            quotes containing any of its words, "all" those containing
+            every word
+
+    Returns:
+        Matching Quote objects in storage order
+
+    Raises:
+        ValueError: If mode isn't one of SEARCH_MODES
+    """
+    if mode not in SEARCH_MODES:
+        raise ValueError(f"Unknown search mode '{mode}'")
+
+    ensure_data_dir()
+
+    if not case_sensitive:
+        query = query.lower()
+    column = 0 if case_sensitive else 1
+
+    words = query.split()
+    if mode == "phrase" or len(words) < 2:
+        # One word, or the whole query as a phrase: a plain substring test
+        def is_match(text: str) -> bool:
+            return query in text
+
+    elif mode == "any":
+        # One pass per quote over an alternation of the words
+        pattern = re.compile("|".join(map(re.escape, words)))
+
+        def is_match(text: str) -> bool:
+            return pattern.search(text) is not None
+
+    else:
+
+        def is_match(text: str) -> bool:
+            return all(word in text for word in words)
+
+    document = _load_document()
+    matches = []
+    for position, texts in enumerate(_searchable_texts(document)):
+        if is_match(texts[column]):
+            try:
+                matches.append(Quote.from_dict(document["quotes"][position]))
+            except Exception:
+                pass  # Skip quotes that can't be loaded
+    return matches
+
+
+def resolve_quote_id(quote_id: str) -> Tuple[Optional[Quote], List[Quote]]:
+    """
+    Find a quote by its full ID or a unique ID prefix.
+
+    Full IDs use the id index; prefixes are found by bisecting the sorted
+    ids, so neither scans the whole collection. An ambiguous prefix stops
+    after MAX_ID_MATCHES + 1 matches, so a short prefix never loads every
+    quote just to report that it is ambiguous.
+
+    Args:
+        quote_id: Full or partial quote ID
+
+    Returns:
+        (quote, matches): quote is the single match, or None when no quote
+        or several quotes match; matches lists the quotes that matched,
+        more than MAX_ID_MATCHES of them meaning the list was cut short
+    """
+    document = _load_document()
+    position = _quote_position(document, quote_id)
+    if position is not None:
+        positions = [position]
+    else:
+        sorted_ids = _sorted_ids(document)
+        positions = []
+        for index in range(
+            bisect.bisect_left(sorted_ids, (quote_id,)), len(sorted_ids)
+        ):
+            candidate_id, candidate_position = sorted_ids[index]
+            if not candidate_id.startswith(quote_id) or len(positions) > MAX_ID_MATCHES:
+                break
+            positions.append(candidate_position)
+
+    try:
+        matches = [Quote.from_dict(document["quotes"][p]) for p in positions]
+    except Exception:
+        return None, []
+
+    if len(matches) == 1:
+        return matches[0], matches
+    return None, matches
 
 
 def update_quote(updated_quote: Quote) -> bool:
@@ -228,15 +666,55 @@ def update_quote(updated_quote: Quote) -> bool:
     Returns:
         True if quote was found and updated, False otherwise
     """
-    quotes = load_quotes()
-    for i, quote in enumerate(quotes):
-        if quote.id == updated_quote.id:
-            # Update the modified timestamp
-            updated_quote.date_modified = datetime.utcnow().isoformat()
-            quotes[i] = updated_quote
-            save_quotes(quotes)
-            return True
-    return False
+    ensure_data_dir()
+
+    document = _load_document()
+    position = _quote_position(document, updated_quote.id)
+    if position is None:
+        return False
+
+    # Update the modified timestamp
+    updated_quote.date_modified = utcnow_iso()
+
+    data = dict(document)
+    data["quotes"] = list(document["quotes"])
+    data["quotes"][position] = updated_quote.to_dict()
+    _write_document(data)
+    return True
+
+
+def update_quote_shown(quote_id: str, shown_at: Optional[str] = None) -> bool:
+    """
+    Record that a quote was shown as the daily quote.
+
+    Bumps the stored quote's times_shown and last_shown and appends to the
+    display history in a single write, without converting every stored
+    quote to a Quote object and back.
+
+    Args:
+        quote_id: ID of the quote that was displayed
+        shown_at: UTC ISO timestamp to store as last_shown (defaults to now)
+
+    Returns:
+        True if quote was found and updated, False otherwise
+    """
+    ensure_data_dir()
+
+    document = _load_document()
+    position = _quote_position(document, quote_id)
+    if position is None:
+        return False
+
+    entry = dict(document["quotes"][position])
+    entry["last_shown"] = shown_at or utcnow_iso()
+    entry["times_shown"] = entry.get("times_shown", 0) + 1
+
+    data = dict(document)
+    data["quotes"] = list(document["quotes"])
+    data["quotes"][position] = entry
+    _record_display(data, quote_id)
+    _write_document(data)
+    return True
 
 
 def delete_quote(quote_id: str) -> bool:
@@ -249,11 +727,16 @@ def delete_quote(quote_id: str) -> bool:
     Returns:
         True if quote was found and deleted, False otherwise
     """
-    quotes = load_quotes()
-    original_count = len(quotes)
-    quotes = [q for q in quotes if q.id != quote_id]
+    ensure_data_dir()
 
-    if len(quotes) < original_count:
-        save_quotes(quotes)
-        return True
-    return False
+    document = _load_document()
+    position = _quote_position(document, quote_id)
+    if position is None:
+        return False
+
+    # Copy (the cached document is shared) and drop the entry by position
+    data = dict(document)
+    data["quotes"] = list(document["quotes"])
+    del data["quotes"][position]
+    _write_document(data)
+    return True
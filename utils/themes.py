@@ -86,7 +86,13 @@ def load_theme(theme_name: str = None) -> Dict[str, str]:
 
     # Priority 3: Config file (optional - future enhancement)
     config_path = Path.home() / ".config" / "quotes-manager" / "config.toml"
-    if config_path.exists():
+    # Open directly rather than checking exists() first: one syscall, not two
+    try:
+        with open(config_path, "rb") as f:
+            config_bytes = f.read()
+    except OSError:
+        config_bytes = None
+    if config_bytes is not None:
         try:
             # Note: tomli only needed for Python < 3.11
             # For Python 3.11+, use: import tomllib
@@ -95,11 +101,10 @@ def load_theme(theme_name: str = None) -> Dict[str, str]:
             except ImportError:
                 import tomli as tomllib  # Python < 3.11
 
-            with open(config_path, "rb") as f:
-                config = tomllib.load(f)
-                config_theme = config.get("display", {}).get("theme")
-                if config_theme and config_theme in THEMES:
-                    return THEMES[config_theme]
+            config = tomllib.loads(config_bytes.decode("utf-8"))
+            config_theme = config.get("display", {}).get("theme")
+            if config_theme and config_theme in THEMES:
+                return THEMES[config_theme]
         except (ImportError, Exception):
             pass  # Fall back to default if config reading fails
 
@@ -107,6 +112,10 @@ def load_theme(theme_name: str = None) -> Dict[str, str]:
     return THEMES["auto"]
 
 
+# utils.display, bound by get_color on first use
+_display_module = None
+
+
 def get_color(purpose: str, theme: Dict[str, str] = None) -> str:
     """
     Get color string for a specific purpose.
@@ -119,8 +128,12 @@ def get_color(purpose: str, theme: Dict[str, str] = None) -> str:
         Color string for Rich styling
     """
     if theme is None:
-        # Import module and access attribute to get current value
-        import utils.display
+        # Read the attribute each call to get the current value; the module is
+        # imported lazily (display imports themes) and kept after first use
+        global _display_module
+        if _display_module is None:
+            import utils.display
 
-        theme = utils.display.THEME
+            _display_module = utils.display
+        theme = _display_module.THEME
     return theme.get(purpose, "default")